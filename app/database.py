@@ -89,6 +89,10 @@ class LocalMultiplier(Base):
     pdf_version_id = Column(Integer, ForeignKey('mvs_pdf_versions.id'), nullable=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    
+    __table_args__ = (
+        Index('ix_local_multiplier_version', 'pdf_version_id'),
+    )
 
 
 class CurrentCostMultiplier(Base):
@@ -7,6 +7,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from datetime import datetime
+import logging
 import os
 
 from app.database import get_db, init_db, BaseCostTable, BaseCostRow, LocalMultiplier, CurrentCostMultiplier, StoryHeightMultiplier, FloorAreaPerimeterMultiplier, SprinklerCost, HvacCost, ElevatorType, ElevatorCost, ElevatorCostPerStop, PdfVersion, ParseRun
@@ -14,6 +15,13 @@ from app.parsers import local_multipliers, current_cost, story_height, floor_are
 from app.parsers import base_cost_tables
 from app.parsers.diff import generate_diff
 
+# Parsers that report progress through logging (app.parsers.*) rather than print()
+# need a handler of their own, or their INFO output is dropped in the service
+_parser_log_handler = logging.StreamHandler()
+_parser_log_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.getLogger("app").addHandler(_parser_log_handler)
+logging.getLogger("app").setLevel(logging.INFO)
+
 app = FastAPI(
     title="MVS Parser Service",
     description="Service for parsing Marshall Valuation Service PDF data and writing to PostgreSQL",
@@ -63,6 +71,19 @@ async def startup():
     except Exception as e:
         print(f"[MVS Parser Service] diff_summary migration skipped: {e}")
 
+    # Index local multipliers by version so per-version re-parses don't scan the table
+    try:
+        from app.database import get_session_local
+        from sqlalchemy import text
+        SessionLocal = get_session_local()
+        db = SessionLocal()
+        db.execute(text("CREATE INDEX IF NOT EXISTS ix_local_multiplier_version ON mvs_local_multipliers (pdf_version_id)"))
+        db.commit()
+        db.close()
+        print("[MVS Parser Service] local multiplier version index migration completed")
+    except Exception as e:
+        print(f"[MVS Parser Service] local multiplier version index migration skipped: {e}")
+
 
 # ============ KNOWN PARSERS REGISTRY ============
 # Defines ALL parsers that should run for a complete parse
@@ -257,8 +278,10 @@ async def mark_pdf_version_parsed(version_id: int, db: Session = Depends(get_db)
 
 
 @app.post("/parse-version/{version_id}/local-multipliers")
-async def parse_version_local_multipliers(version_id: int, start_page: int = None, end_page: int = None, db: Session = Depends(get_db)):
-    """Parse local multipliers from a stored PDF version"""
+async def parse_version_local_multipliers(version_id: int, start_page: int = None, end_page: int = None,
+                                          force_refresh: bool = False, db: Session = Depends(get_db)):
+    """Parse local multipliers from a stored PDF version.
+    Pass force_refresh=true to ignore cached parser results."""
     version = db.query(PdfVersion).filter(PdfVersion.id == version_id).first()
     if not version:
         raise HTTPException(status_code=404, detail="PDF version not found")
@@ -267,7 +290,7 @@ async def parse_version_local_multipliers(version_id: int, start_page: int = Non
 
     run = start_parse_run(db, version_id, "local_multipliers")
     try:
-        kwargs = {"pdf_version_id": version_id}
+        kwargs = {"pdf_version_id": version_id, "force_refresh": force_refresh}
         if start_page is not None:
             kwargs["start_page"] = start_page
         if end_page is not None:
@@ -305,8 +328,10 @@ async def parse_version_current_cost(version_id: int, page: int = None, db: Sess
 
 
 @app.post("/parse-version/{version_id}/story-height")
-async def parse_version_story_height(version_id: int, section: int = 11, start_page: int = None, db: Session = Depends(get_db)):
-    """Parse story height multipliers from a stored PDF version for a specific section"""
+async def parse_version_story_height(version_id: int, section: int = 11, start_page: int = None,
+                                     force_refresh: bool = False, db: Session = Depends(get_db)):
+    """Parse story height multipliers from a stored PDF version for a specific section.
+    Pass force_refresh=true to re-parse even if this version's section was already saved."""
     version = db.query(PdfVersion).filter(PdfVersion.id == version_id).first()
     if not version:
         raise HTTPException(status_code=404, detail="PDF version not found")
@@ -317,7 +342,8 @@ async def parse_version_story_height(version_id: int, section: int = 11, start_p
     run = start_parse_run(db, version_id, parser_name)
     try:
         page = start_page if start_page is not None else story_height.SECTION_STORY_HEIGHT_PAGES.get(section, 90)
-        result = story_height.parse_and_save(version.storage_path, db, page=page, section=section, pdf_version_id=version_id)
+        result = story_height.parse_and_save(version.storage_path, db, page=page, section=section, pdf_version_id=version_id,
+                                             force_refresh=force_refresh, file_hash=version.file_hash)
         diff_json = generate_diff(db, version_id, parser_name)
         complete_parse_run(db, run, result, diff_json=diff_json)
         return {"success": True, "records_updated": result, "section": section, "pdf_version_id": version_id}
@@ -327,8 +353,9 @@ async def parse_version_story_height(version_id: int, section: int = 11, start_p
 
 
 @app.post("/parse-version/{version_id}/story-height/all-sections")
-async def parse_version_story_height_all(version_id: int, db: Session = Depends(get_db)):
-    """Parse story height multipliers for ALL known sections from a stored PDF version"""
+async def parse_version_story_height_all(version_id: int, force_refresh: bool = False, db: Session = Depends(get_db)):
+    """Parse story height multipliers for ALL known sections from a stored PDF version.
+    Pass force_refresh=true to re-parse sections that were already saved."""
     version = db.query(PdfVersion).filter(PdfVersion.id == version_id).first()
     if not version:
         raise HTTPException(status_code=404, detail="PDF version not found")
@@ -341,7 +368,8 @@ async def parse_version_story_height_all(version_id: int, db: Session = Depends(
         run = start_parse_run(db, version_id, parser_name)
         try:
             page = story_height.SECTION_STORY_HEIGHT_PAGES[section]
-            result = story_height.parse_and_save(version.storage_path, db, page=page, section=section, pdf_version_id=version_id)
+            result = story_height.parse_and_save(version.storage_path, db, page=page, section=section, pdf_version_id=version_id,
+                                                 force_refresh=force_refresh, file_hash=version.file_hash)
             diff_json = generate_diff(db, version_id, parser_name)
             complete_parse_run(db, run, result, diff_json=diff_json)
             section_results[section] = result
@@ -438,7 +466,8 @@ async def parse_version_all(version_id: int, db: Session = Depends(get_db)):
         run = start_parse_run(db, version_id, parser_name)
         try:
             page = story_height.SECTION_STORY_HEIGHT_PAGES[section]
-            count = story_height.parse_and_save(version.storage_path, db, page=page, section=section, pdf_version_id=version_id)
+            count = story_height.parse_and_save(version.storage_path, db, page=page, section=section, pdf_version_id=version_id,
+                                                file_hash=version.file_hash)
             diff_json = generate_diff(db, version_id, parser_name)
             complete_parse_run(db, run, count, diff_json=diff_json)
             results[parser_name] = count
@@ -540,6 +569,7 @@ async def get_stats(db: Session = Depends(get_db)):
 async def parse_local_multipliers_endpoint(
     pdf_file: UploadFile = File(...),
     pdf_version_id: int = None,
+    force_refresh: bool = False,
     db: Session = Depends(get_db)
 ):
     """Parse local multipliers from uploaded PDF and update database"""
@@ -550,7 +580,8 @@ async def parse_local_multipliers_endpoint(
             content = await pdf_file.read()
             f.write(content)
         
-        result = local_multipliers.parse_and_save(temp_path, db, pdf_version_id=pdf_version_id)
+        result = local_multipliers.parse_and_save(temp_path, db, pdf_version_id=pdf_version_id,
+                                                  force_refresh=force_refresh)
         
         # Clean up
         os.remove(temp_path)
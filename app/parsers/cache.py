@@ -0,0 +1,42 @@
+"""
+On-disk cache helpers shared by the MVS parsers
+
+Everything lives under ~/.cache/mvs_parser. Files are written to a temp file
+and swapped in with os.replace(), so a concurrent reader never sees half a
+file.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+CACHE_DIR = Path.home() / ".cache" / "mvs_parser"
+
+
+def pdf_sha256(pdf_path: str) -> str:
+    """SHA-256 hex digest of the PDF file's bytes; raises OSError if it cannot be read"""
+    with open(pdf_path, 'rb') as fh:
+        return hashlib.file_digest(fh, 'sha256').hexdigest()
+
+
+def load_json(path: Path) -> Any:
+    """Contents of a JSON cache file, or None if it is missing or unreadable"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_atomic(path: Path, data: Any, default: Optional[Callable] = None) -> None:
+    """
+    Write data to path as JSON without exposing a partly written file
+
+    Raises OSError; callers decide whether a failed cache write is worth a warning.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp_path.write_text(json.dumps(data, default=default), encoding='utf-8')
+    os.replace(tmp_path, path)
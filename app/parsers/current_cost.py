@@ -86,12 +86,12 @@ def parse_and_save(pdf_path: str, db: Session, page: int = 717, pdf_version_id:
     # Save multipliers to database
     for m in multipliers:
         record = CurrentCostMultiplier(
-            method=m['method'],
-            region=m['region'],
-            building_class=m['building_class'],
-            effective_date=m['effective_date'],
-            multiplier=m['multiplier'],
-            source_page=m['source_page'],
+            method=m.method,
+            region=m.region,
+            building_class=m.building_class,
+            effective_date=m.effective_date,
+            multiplier=m.multiplier,
+            source_page=m.source_page,
             pdf_version_id=pdf_version_id,
         )
         db.add(record)
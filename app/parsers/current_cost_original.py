@@ -11,9 +11,24 @@ WAITING FOR USER INPUT:
 import pdfplumber
 import json
 import sys
+from dataclasses import dataclass, asdict
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Dict, Optional
 
+
+@dataclass(slots=True)
+class Multiplier:
+    """A single current cost multiplier entry"""
+    method: str
+    region: str
+    building_class: str
+    effective_date: str
+    multiplier: float
+    source_page: int
+
+
 def parse_current_cost_multiplier_table(pdf_path: str, start_page: int, end_page: int) -> Dict:
     """
     Parse current cost multiplier tables from specified page range
@@ -86,7 +101,7 @@ def parse_current_cost_multiplier_table(pdf_path: str, start_page: int, end_page
     return results
 
 
-def parse_page_current_cost(page, page_text: str, page_num: int) -> List[Dict]:
+def parse_page_current_cost(page, page_text: str, page_num: int) -> List[Multiplier]:
     """
     Parse current cost multiplier entries from a single page
     
@@ -149,7 +164,7 @@ def parse_page_current_cost(page, page_text: str, page_num: int) -> List[Dict]:
     return multipliers
 
 
-def parse_region_based_multipliers(page, page_num: int) -> List[Dict]:
+def parse_region_based_multipliers(page, page_num: int) -> List[Multiplier]:
     """
     Parse multipliers by splitting page into left (Calculator) and right (Segregated) regions
     
@@ -202,10 +217,14 @@ def parse_region_based_multipliers(page, page_num: int) -> List[Dict]:
     return multipliers
 
 
-def parse_single_table_text(text: str, method: str, page_num: int) -> List[Dict]:
+def parse_single_table_text(text: str, method: str, page_num: int) -> List[Multiplier]:
     """
     Parse a single table's text content (either Calculator or Segregated)
     
+    Walks the lines once. Date headers are accumulated until the first region
+    label after them; class rows are held in a small pending buffer until the
+    dates are final and their region is known, then flushed in line order.
+    
     Args:
         text: Extracted text from the table region
         method: 'calculator' or 'segregated'
@@ -220,56 +239,90 @@ def parse_single_table_text(text: str, method: str, page_num: int) -> List[Dict]
     lines = text.split('\n')
     current_region = None
     effective_dates = []
-    in_data_section = False
-    
-    # First pass: accumulate all date headers before processing data
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        line_upper = line.upper()
-        
-        # Stop accumulating dates once we hit region headers or data
-        if any(kw in line_upper for kw in ['EASTERN', 'CENTRAL', 'WESTERN']) and effective_dates:
-            break
-        
-        # Look for dates in parentheses format
-        paren_date_pattern = r'\((\d{1,2})/(\d{2,4})\)'
-        if re.search(paren_date_pattern, line):
-            date_matches = re.findall(paren_date_pattern, line)
-            for month, year in date_matches:
-                # Normalize year
-                if len(year) == 2:
-                    year = '20' + year if int(year) < 50 else '19' + year
-                date_str = f"{int(month)}/{year}"
-                if date_str not in effective_dates:
-                    effective_dates.append(date_str)
-    
-    if effective_dates:
-        print(f"      Found {len(effective_dates)} effective dates: {', '.join(effective_dates[:4])}...")
-        in_data_section = True
-    
-    # Helper function to look ahead for next region
-    def find_next_region(start_idx, lines):
-        """Look ahead to find the next region label"""
-        for i in range(start_idx + 1, len(lines)):
-            line_upper = lines[i].upper()
-            if 'EASTERN' in line_upper and 'EFFECTIVE' not in line_upper and not ('CENTRAL' in line_upper and 'WESTERN' in line_upper):
-                return 'Eastern'
-            elif 'CENTRAL' in line_upper and 'EFFECTIVE' not in line_upper and not ('EASTERN' in line_upper and 'WESTERN' in line_upper):
-                return 'Central'
-            elif 'WESTERN' in line_upper and 'EFFECTIVE' not in line_upper and not ('EASTERN' in line_upper and 'CENTRAL' in line_upper):
-                return 'Western'
+    paren_date_pattern = r'\((\d{1,2})/(\d{2,4})\)'
+    
+    # 'seek_dates' until the first region label after the date headers, then 'seek_data'
+    state = 'seek_dates'
+    # Buffered rows: [building_class, multiplier_values, region, awaiting_next_region]
+    pending = []
+    last_sd_idx = None
+    
+    def region_label(line_upper):
+        """Region named by a line, ignoring header rows that list several regions"""
+        if 'EASTERN' in line_upper and 'EFFECTIVE' not in line_upper and not ('CENTRAL' in line_upper and 'WESTERN' in line_upper):
+            return 'Eastern'
+        elif 'CENTRAL' in line_upper and 'EFFECTIVE' not in line_upper and not ('EASTERN' in line_upper and 'WESTERN' in line_upper):
+            return 'Central'
+        elif 'WESTERN' in line_upper and 'EFFECTIVE' not in line_upper and not ('EASTERN' in line_upper and 'CENTRAL' in line_upper):
+            return 'Western'
         return None
     
-    # Second pass: process data rows
+    def flush(final=False):
+        """Emit buffered rows from the front until one is still waiting on its region"""
+        flushed = 0
+        for building_class, multiplier_values, target_region, awaiting in pending:
+            if awaiting and not final:
+                break
+            flushed += 1
+            
+            if not effective_dates or not target_region:
+                continue
+            
+            if len(multiplier_values) != len(effective_dates):
+                print(f"      [!] Class {building_class} in {target_region}: Found {len(multiplier_values)} values but {len(effective_dates)} dates")
+            
+            # Match multipliers to dates
+            for mult_val, effective_date in zip(multiplier_values, effective_dates):
+                multipliers.append(Multiplier(
+                    method=method,
+                    region=target_region,
+                    building_class=building_class,
+                    effective_date=effective_date,
+                    multiplier=mult_val,
+                    source_page=page_num,
+                ))
+        del pending[:flushed]
+    
     for idx, line in enumerate(lines):
         line = line.strip()
+        line_upper = line.upper()
+        
+        # Special handling for A and B classes that appear before region labels:
+        # the next region label seen claims any rows that were waiting on it
+        if any(row[3] for row in pending):
+            next_region = region_label(line_upper)
+            if next_region:
+                for row in pending:
+                    if row[3]:
+                        row[2] = next_region
+                        row[3] = False
+                        print(f"      Look-ahead: Attributing {row[0]} to {next_region} (next region)")
+        
+        if state == 'seek_data':
+            flush()
+        
+        # Rows within three lines after an S or D row may belong to the next region
+        recent_sd = last_sd_idx is not None and idx - last_sd_idx <= 3
+        if line.startswith(('S ', 'D ')):
+            last_sd_idx = idx
+        
         if not line:
             continue
         
-        line_upper = line.upper()
+        if state == 'seek_dates':
+            # Stop accumulating dates once we hit region headers or data
+            if any(kw in line_upper for kw in ['EASTERN', 'CENTRAL', 'WESTERN']) and effective_dates:
+                state = 'seek_data'
+                print(f"      Found {len(effective_dates)} effective dates: {', '.join(effective_dates[:4])}...")
+            else:
+                # Look for dates in parentheses format
+                for month, year in re.findall(paren_date_pattern, line):
+                    # Normalize year
+                    if len(year) == 2:
+                        year = '20' + year if int(year) < 50 else '19' + year
+                    date_str = f"{int(month)}/{year}"
+                    if date_str not in effective_dates:
+                        effective_dates.append(date_str)
         
         # Skip header rows
         if any(keyword in line_upper for keyword in ['CLASS', 'MULTIPLIER', 'SECTION', 'APPLY', 'COST', 'EFFECTIVE', 'PAGES']):
@@ -301,12 +354,6 @@ def parse_single_table_text(text: str, method: str, page_num: int) -> List[Dict]
             # If there's no content left after removing region label, skip this line
             if not line:
                 continue
-            # Reparse line after removing region label
-            line_upper = line.upper()
-        
-        # Extract data rows
-        if not effective_dates or not in_data_section:
-            continue
         
         # Data row format: "A  1.06  1.06  1.06..."
         parts = line.split()
@@ -315,32 +362,16 @@ def parse_single_table_text(text: str, method: str, page_num: int) -> List[Dict]
         if not parts or parts[0] not in ['A', 'B', 'C', 'D', 'S']:
             continue
         
-        # Special handling for A and B classes that appear before region labels
-        # If we see A or B and current_region is not set OR if previous line was S/D,
-        # look ahead to find which region these belong to
         building_class = parts[0]
-        target_region = current_region
-        
-        if building_class in ['A', 'B']:
-            # Check if we need to look ahead for the region
-            # This happens when A/B appear before the region label
-            if current_region is None or (idx > 0 and any(
-                lines[i].strip().startswith(('S ', 'D ')) for i in range(max(0, idx-3), idx)
-            )):
-                next_region = find_next_region(idx, lines)
-                if next_region:
-                    target_region = next_region
-                    print(f"      Look-ahead: Attributing {building_class} to {target_region} (next region)")
-        
-        if not target_region:
-            continue
+        # A/B rows with no region yet, or right after an S/D row, wait for the next region label
+        awaiting = building_class in ['A', 'B'] and (current_region is None or recent_sd)
         
-        building_class = parts[0]
-        value_parts = parts[1:]
+        if not current_region and not awaiting:
+            continue
         
         # Extract numeric values (multipliers)
         multiplier_values = []
-        for part in value_parts:
+        for part in parts[1:]:
             # Clean part and try to parse
             clean_part = part.strip('()').replace(',', '')
             
@@ -356,31 +387,17 @@ def parse_single_table_text(text: str, method: str, page_num: int) -> List[Dict]
             except ValueError:
                 continue
         
-        # Debug: Show mismatch if any
-        if multiplier_values and target_region:
-            if len(multiplier_values) != len(effective_dates):
-                print(f"      [!] Class {building_class} in {target_region}: Found {len(multiplier_values)} values but {len(effective_dates)} dates")
-            
-            # Match multipliers to dates
-            num_entries = min(len(multiplier_values), len(effective_dates))
-            
-            for idx in range(num_entries):
-                mult_val = multiplier_values[idx]
-                effective_date = effective_dates[idx]
-                
-                multipliers.append({
-                    'method': method,
-                    'region': target_region,
-                    'building_class': building_class,
-                    'effective_date': effective_date,
-                    'multiplier': mult_val,
-                    'source_page': page_num
-                })
+        if multiplier_values:
+            pending.append([building_class, multiplier_values, current_region, awaiting])
+    
+    flush(final=True)
+    if state == 'seek_dates' and effective_dates:
+        print(f"      Found {len(effective_dates)} effective dates: {', '.join(effective_dates[:4])}...")
     
     return multipliers
 
 
-def parse_multiplier_table(table: List[List[str]], method: str, page_num: int) -> List[Dict]:
+def parse_multiplier_table(table: List[List[str]], method: str, page_num: int) -> List[Multiplier]:
     """
     Parse a single multiplier table (Calculator or Segregated)
     
@@ -467,14 +484,14 @@ def parse_multiplier_table(table: List[List[str]], method: str, page_num: int) -
                     # If we don't have enough dates, use index as placeholder
                     effective_date = f"Column_{idx+1}"
                 
-                multipliers.append({
-                    'method': method,
-                    'region': current_region,
-                    'building_class': building_class,
-                    'effective_date': effective_date,
-                    'multiplier': multiplier_val,
-                    'source_page': page_num
-                })
+                multipliers.append(Multiplier(
+                    method=method,
+                    region=current_region,
+                    building_class=building_class,
+                    effective_date=effective_date,
+                    multiplier=multiplier_val,
+                    source_page=page_num,
+                ))
     
     return multipliers
 
@@ -519,26 +536,26 @@ def get_region_for_state(state: str) -> str:
         return 'Central'
 
 
-def save_to_json(multipliers: List[Dict], output_path: str) -> None:
+def save_to_json(multipliers: List[Multiplier], output_path: str) -> None:
     """Save parsed multipliers to JSON file"""
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
     # Calculate statistics
-    methods = set(m['method'] for m in multipliers)
-    regions = set(m['region'] for m in multipliers)
-    classes = set(m['building_class'] for m in multipliers)
-    dates = set(m['effective_date'] for m in multipliers)
+    methods = set(m.method for m in multipliers)
+    regions = set(m.region for m in multipliers)
+    classes = set(m.building_class for m in multipliers)
+    dates = set(m.effective_date for m in multipliers)
     
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump({
             'metadata': {
                 'source': 'Marshall Valuation Service - Section 99, Page 3 (PDF Page 717)',
                 'description': 'Current cost multipliers for bringing costs up to date',
-                'methods': sorted(list(methods)),
-                'regions': sorted(list(regions)),
-                'building_classes': sorted(list(classes)),
-                'effective_dates': sorted(list(dates)),
+                'methods': sorted(methods),
+                'regions': sorted(regions),
+                'building_classes': sorted(classes),
+                'effective_dates': sorted(dates),
                 'total_entries': len(multipliers),
                 'note': 'Use get_region_for_state() to map state codes to regions'
             },
@@ -547,7 +564,7 @@ def save_to_json(multipliers: List[Dict], output_path: str) -> None:
                 'Central': ['ND', 'SD', 'NE', 'KS', 'OK', 'TX', 'MN', 'IA', 'MO', 'AR', 'LA', 'WI', 'IL', 'MI', 'IN', 'OH', 'KY', 'TN', 'MS', 'AL'],
                 'Western': ['WA', 'OR', 'CA', 'NV', 'ID', 'MT', 'WY', 'UT', 'CO', 'AZ', 'NM', 'AK', 'HI']
             },
-            'multipliers': multipliers
+            'multipliers': [asdict(m) for m in multipliers]
         }, f, indent=2)
     
     print(f"[SAVED] JSON: {output_file}")
@@ -556,7 +573,7 @@ def save_to_json(multipliers: List[Dict], output_path: str) -> None:
     print(f"   Effective dates: {len(dates)}")
 
 
-def save_to_markdown(multipliers: List[Dict], output_path: str) -> None:
+def save_to_markdown(multipliers: List[Multiplier], output_path: str) -> None:
     """Save parsed multipliers to markdown file"""
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -579,40 +596,28 @@ def save_to_markdown(multipliers: List[Dict], output_path: str) -> None:
         f.write("- **Western:** WA, OR, CA, NV, ID, MT, WY, UT, CO, AZ, NM, AK, HI\n\n")
         
         if multipliers:
-            # Group by method
-            by_method = {}
-            for mult in multipliers:
-                method = mult.get('method', 'unknown')
-                if method not in by_method:
-                    by_method[method] = []
-                by_method[method].append(mult)
+            # One sort orders everything for output; group by method, then region
+            region_order = {'Eastern': 0, 'Central': 1, 'Western': 2}
+            ordered = sorted(
+                multipliers,
+                key=lambda x: (x.method, region_order.get(x.region, 3), x.building_class, x.effective_date)
+            )
             
-            for method, entries in sorted(by_method.items()):
+            for method, entries in groupby(ordered, key=attrgetter('method')):
                 f.write(f"## {method.upper()} Cost Sections\n\n")
                 
-                # Group by region within each method
-                by_region = {}
-                for mult in entries:
-                    region = mult.get('region', 'unknown')
-                    if region not in by_region:
-                        by_region[region] = []
-                    by_region[region].append(mult)
-                
-                for region in ['Eastern', 'Central', 'Western']:
-                    if region in by_region:
-                        f.write(f"### {region} Region\n\n")
-                        f.write("| Class | Effective Date | Multiplier | Page |\n")
-                        f.write("| --- | --- | --- | --- |\n")
-                        
-                        for mult in sorted(by_region[region], key=lambda x: (x['building_class'], x['effective_date'])):
-                            bldg_class = mult.get('building_class', '')
-                            date = mult.get('effective_date', '')
-                            multiplier = mult.get('multiplier', '')
-                            page = mult.get('source_page', '')
-                            
-                            f.write(f"| {bldg_class} | {date} | {multiplier} | {page} |\n")
-                        
-                        f.write("\n")
+                for region, rows in groupby(entries, key=attrgetter('region')):
+                    if region not in region_order:
+                        continue
+                    
+                    f.write(f"### {region} Region\n\n")
+                    f.write("| Class | Effective Date | Multiplier | Page |\n")
+                    f.write("| --- | --- | --- | --- |\n")
+                    
+                    for mult in rows:
+                        f.write(f"| {mult.building_class} | {mult.effective_date} | {mult.multiplier} | {mult.source_page} |\n")
+                    
+                    f.write("\n")
         else:
             f.write("*No multipliers extracted*\n")
     
@@ -621,8 +626,8 @@ def save_to_markdown(multipliers: List[Dict], output_path: str) -> None:
 
 def main():
     if len(sys.argv) < 4:
-        print("Usage: python parse-current-cost-multiplier.py <pdf_path> <start_page> <end_page>")
-        print("Example: python parse-current-cost-multiplier.py MVS.pdf 717 717")
+        print("Usage: python -m app.parsers.current_cost_original <pdf_path> <start_page> <end_page>")
+        print("Example: python -m app.parsers.current_cost_original MVS.pdf 717 717")
         print("\nParser is ready! Extract from Section 99, Page 3 (PDF page 717)")
         sys.exit(1)
     
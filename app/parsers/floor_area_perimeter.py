@@ -9,7 +9,10 @@ from sqlalchemy.orm import Session
 from app.database import FloorAreaPerimeterMultiplier
 
 # Import from the original parser
-from app.parsers.floor_area_perimeter_original import parse_area_perimeter_table
+from app.parsers.floor_area_perimeter_original import (
+    parse_area_perimeter_table,
+    parse_area_perimeter_tables,
+)
 
 
 # Section-specific PDF page numbers for floor area/perimeter tables
@@ -61,10 +64,10 @@ def parse_and_save(pdf_path: str, db: Session, page: int = 90, section: int = 11
     for m in multipliers:
         record = FloorAreaPerimeterMultiplier(
             section=section,
-            floor_area_sqft=m['floor_area_sqft'],
-            perimeter_ft=m['perimeter_ft'],
-            multiplier=m['multiplier'],
-            source_page=m.get('source_page', page),
+            floor_area_sqft=m.floor_area_sqft,
+            perimeter_ft=m.perimeter_ft,
+            multiplier=m.multiplier,
+            source_page=page,
             pdf_version_id=pdf_version_id,
         )
         db.add(record)
@@ -94,9 +97,10 @@ def parse_and_save_section(pdf_path: str, db: Session, section: int, pdf_version
         print(f"[FloorAreaPerimeter] Cleared {deleted} existing records for section {section}, version {pdf_version_id}")
     
     total = 0
-    for page in pages:
+    # Open the PDF once for all of this section's pages
+    all_results = parse_area_perimeter_tables(pdf_path, pages)
+    for page, results in zip(pages, all_results):
         try:
-            results = parse_area_perimeter_table(pdf_path, page)
             if not results['success']:
                 print(f"[FloorAreaPerimeter] Parser failed for section {section} page {page}: {results['errors']}")
                 continue
@@ -105,10 +109,10 @@ def parse_and_save_section(pdf_path: str, db: Session, section: int, pdf_version
             for m in multipliers:
                 record = FloorAreaPerimeterMultiplier(
                     section=section,
-                    floor_area_sqft=m['floor_area_sqft'],
-                    perimeter_ft=m['perimeter_ft'],
-                    multiplier=m['multiplier'],
-                    source_page=m.get('source_page', page),
+                    floor_area_sqft=m.floor_area_sqft,
+                    perimeter_ft=m.perimeter_ft,
+                    multiplier=m.multiplier,
+                    source_page=page,
                     pdf_version_id=pdf_version_id,
                 )
                 db.add(record)
@@ -11,11 +11,47 @@ Table structure:
 
 import pdfplumber
 import json
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Tuple
-from collections import defaultdict
+from typing import List, Dict, Optional, Tuple
+from collections import Counter, defaultdict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Patterns used on every page, compiled once
+_SECTION_RE = re.compile(r'SECTION\s+(\d+)\s+PAGE\s+(\d+)', re.IGNORECASE)
+_TABLE_START_RE = re.compile(r'FLOOR\s+AREA\s*/\s*PERIMETER\s+MULTIPLIER', re.IGNORECASE)
+_TABLE_END_RE = re.compile(r'STORY\s+HEIGHT\s+MULTIPLIER', re.IGNORECASE)
+# Plain decimal number (commas already stripped); checked before calling float()
+_NUM_RE = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)')
+
+# Known perimeter values (ft) from the table header
+_PERIMETER_VALUES_FT = (160, 180, 200, 250, 300, 350, 400, 500, 600, 700, 800, 1000, 1200, 1400, 1600, 2000)
+_PERIMETER_SET = frozenset(_PERIMETER_VALUES_FT)
+
+# Known floor area values (sq ft) from the table
+_FLOOR_AREA_VALUES_FT = (1500, 2000, 2500, 3000, 4000, 5000, 6000, 7000, 8000, 9000,
+                         10000, 12000, 14000, 16000, 18000, 20000, 24000, 28000,
+                         32000, 36000, 40000)
+_FLOOR_AREA_SET = frozenset(_FLOOR_AREA_VALUES_FT)
+
+
+@dataclass(slots=True)
+class Multiplier:
+    """A single floor area/perimeter multiplier cell"""
+    floor_area_sqft: int
+    perimeter_ft: int
+    multiplier: float
 
 
 def extract_section_info(page_text: str) -> Tuple[str, str]:
@@ -23,7 +59,7 @@ def extract_section_info(page_text: str) -> Tuple[str, str]:
     section = ""
     section_page = ""
     
-    match = re.search(r'SECTION\s+(\d+)\s+PAGE\s+(\d+)', page_text, re.IGNORECASE)
+    match = _SECTION_RE.search(page_text)
     if match:
         section = match.group(1)
         section_page = match.group(2)
@@ -31,18 +67,87 @@ def extract_section_info(page_text: str) -> Tuple[str, str]:
     return section, section_page
 
 
-def parse_area_perimeter_table(pdf_path: str, pdf_page: int) -> Dict:
+def parse_area_perimeter_table(pdf_path: str, pdf_page: int, pdf=None) -> Dict:
     """
     Parse floor area/perimeter multiplier table from specified PDF page
     
     Args:
         pdf_path: Path to MVS PDF file
         pdf_page: PDF page number (1-indexed)
+        pdf: Already-open pdfplumber PDF to reuse instead of opening pdf_path again
     
     Returns:
         Dictionary containing parsed multiplier data and metadata
     """
-    results = {
+    return parse_area_perimeter_tables(pdf_path, [pdf_page], pdf=pdf)[0]
+
+
+def parse_area_perimeter_tables(pdf_path: str, pdf_pages: List[int], pdf=None) -> List[Dict]:
+    """
+    Parse floor area/perimeter multiplier tables from several PDF pages,
+    opening the PDF only once for the whole batch
+    
+    Args:
+        pdf_path: Path to MVS PDF file
+        pdf_pages: PDF page numbers (1-indexed)
+        pdf: Already-open pdfplumber PDF to reuse instead of opening pdf_path
+             again; the caller keeps ownership of it
+    
+    Returns:
+        List of per-page result dictionaries, in the same order as pdf_pages
+    """
+    if pdf is not None:
+        return [parse_area_perimeter_page(pdf, pdf_page) for pdf_page in pdf_pages]
+    
+    try:
+        print(f"[*] Opening PDF: {pdf_path}")
+        
+        # Parse from a memory map of the file so pdfminer's many small reads hit
+        # memory instead of issuing a read syscall each
+        with open(pdf_path, 'rb') as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            with pdfplumber.open(buf) as pdf:
+                return [parse_area_perimeter_page(pdf, pdf_page) for pdf_page in pdf_pages]
+            
+    except FileNotFoundError:
+        error_msg = f"PDF file not found: {pdf_path}"
+    except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+    
+    print(f"[ERROR] {error_msg}")
+    all_results = [new_page_results(pdf_page) for pdf_page in pdf_pages]
+    for results in all_results:
+        results['errors'].append(error_msg)
+    return all_results
+
+
+def parse_area_perimeter_tables_parallel(pdf_path: str, pdf_pages: List[int], max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Parse floor area/perimeter multiplier tables with the pages spread across
+    worker processes
+    
+    Each worker opens the PDF itself; the file is memory-mapped, so the pages
+    come from the shared OS page cache rather than being pickled per task.
+    Falls back to the in-process batch for a single page.
+    
+    Args:
+        pdf_path: Path to MVS PDF file
+        pdf_pages: PDF page numbers (1-indexed)
+        max_workers: Worker process count (default: one per page, up to the CPU count)
+    
+    Returns:
+        List of per-page result dictionaries, in the same order as pdf_pages
+    """
+    if len(pdf_pages) < 2:
+        return parse_area_perimeter_tables(pdf_path, pdf_pages)
+    
+    max_workers = max_workers or min(len(pdf_pages), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(partial(parse_area_perimeter_table, pdf_path), pdf_pages))
+
+
+def new_page_results(pdf_page: int) -> Dict:
+    """Empty result dictionary for one PDF page"""
+    return {
         'success': False,
         'section': '',
         'section_page': '',
@@ -52,42 +157,50 @@ def parse_area_perimeter_table(pdf_path: str, pdf_page: int) -> Dict:
         'multipliers': [],
         'errors': []
     }
+
+
+def parse_area_perimeter_page(pdf, pdf_page: int) -> Dict:
+    """
+    Parse floor area/perimeter multiplier table from one page of an open PDF
+    
+    Args:
+        pdf: Open pdfplumber PDF
+        pdf_page: PDF page number (1-indexed)
+    
+    Returns:
+        Dictionary containing parsed multiplier data and metadata
+    """
+    results = new_page_results(pdf_page)
     
     try:
-        print(f"[*] Opening PDF: {pdf_path}")
         print(f"[*] Processing PDF page {pdf_page}")
         
-        with pdfplumber.open(pdf_path) as pdf:
-            if pdf_page < 1 or pdf_page > len(pdf.pages):
-                raise ValueError(f"Invalid page. PDF has {len(pdf.pages)} pages.")
-            
-            page = pdf.pages[pdf_page - 1]
-            page_text = page.extract_text()
-            
-            # Extract section info
-            section, section_page = extract_section_info(page_text)
-            results['section'] = section
-            results['section_page'] = section_page
-            print(f"   Section {section}, Page {section_page}")
-            
-            # Parse the table data
-            data = parse_floor_area_perimeter_data(page, page_text)
+        if pdf_page < 1 or pdf_page > len(pdf.pages):
+            raise ValueError(f"Invalid page. PDF has {len(pdf.pages)} pages.")
+        
+        page = pdf.pages[pdf_page - 1]
+        page_text = page.extract_text()
+        
+        # Extract section info
+        section, section_page = extract_section_info(page_text)
+        results['section'] = section
+        results['section_page'] = section_page
+        print(f"   Section {section}, Page {section_page}")
+        
+        # Parse the table data
+        data = parse_floor_area_perimeter_data(page, page_text)
+        
+        if data:
+            results['success'] = True
+            results['perimeter_values'] = data['perimeter_values']
+            results['floor_area_values'] = data['floor_area_values']
+            results['multipliers'] = data['multipliers']
+            print(f"   [+] Found {len(data['floor_area_values'])} floor areas x {len(data['perimeter_values'])} perimeters")
+            print(f"   [+] Total multiplier entries: {len(data['multipliers'])}")
+        else:
+            results['errors'].append("No table data found")
+            print(f"   [!] No table data found")
             
-            if data:
-                results['success'] = True
-                results['perimeter_values'] = data['perimeter_values']
-                results['floor_area_values'] = data['floor_area_values']
-                results['multipliers'] = data['multipliers']
-                print(f"   [+] Found {len(data['floor_area_values'])} floor areas x {len(data['perimeter_values'])} perimeters")
-                print(f"   [+] Total multiplier entries: {len(data['multipliers'])}")
-            else:
-                results['errors'].append("No table data found")
-                print(f"   [!] No table data found")
-                
-    except FileNotFoundError:
-        error_msg = f"PDF file not found: {pdf_path}"
-        print(f"[ERROR] {error_msg}")
-        results['errors'].append(error_msg)
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
         print(f"[ERROR] {error_msg}")
@@ -96,197 +209,261 @@ def parse_area_perimeter_table(pdf_path: str, pdf_page: int) -> Dict:
     return results
 
 
+def find_table_bounds(page, words: List[Dict]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Locate the FLOOR AREA/PERIMETER MULTIPLIERS heading and the STORY HEIGHT
+    MULTIPLIERS heading that ends the table
+    
+    Uses page.search(), which reuses the text layout already built by
+    extract_text(), and falls back to scanning the page's words (as already
+    extracted by the caller) when the heading is not laid out on a single line.
+    
+    Returns:
+        Tuple of (table_start_y, table_end_y); either may be None
+    """
+    end_matches = page.search(_TABLE_END_RE)
+    table_end_y = end_matches[0]['top'] if end_matches else None
+    
+    start_matches = [
+        m for m in page.search(_TABLE_START_RE)
+        if table_end_y is None or m['top'] < table_end_y
+    ]
+    if not start_matches:
+        return find_table_bounds_in_words(words)
+    
+    table_start_y = start_matches[-1]['top']
+    print(f"   Found FLOOR AREA/PERIMETER MULTIPLIERS at y={table_start_y:.0f}")
+    if table_end_y is not None:
+        print(f"   Found STORY HEIGHT MULTIPLIERS at y={table_end_y:.0f}")
+    
+    return table_start_y, table_end_y
+
+
+def find_table_bounds_in_words(words: List[Dict]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Locate the table headings by scanning the page's words
+    
+    Words are bucketed by Y once; each heading check then looks at a bucket and
+    its two neighbours instead of re-filtering every word on the page.
+    """
+    table_start_y = None
+    table_end_y = None
+    
+    rows = defaultdict(list)
+    for w in words:
+        rows[round(w['top'] / 5) * 5].append(w)
+    
+    row_text = {y: ' '.join(w['text'].upper() for w in bucket) for y, bucket in rows.items()}
+    
+    for y in sorted(rows):
+        nearby_text = ' '.join(row_text.get(k, '') for k in (y - 5, y, y + 5))
+        
+        perimeter_words = [w for w in rows[y] if 'PERIMETER' in w['text'].upper()]
+        if perimeter_words and 'FLOOR' in nearby_text and 'MULTIPLIER' in nearby_text:
+            table_start_y = min(w['top'] for w in perimeter_words)
+            print(f"   Found FLOOR AREA/PERIMETER MULTIPLIERS at y={table_start_y:.0f}")
+        
+        story_words = [w for w in rows[y] if w['text'].upper() == 'STORY']
+        if story_words and 'HEIGHT' in nearby_text and 'MULTIPLIER' in nearby_text:
+            table_end_y = min(w['top'] for w in story_words)
+            print(f"   Found STORY HEIGHT MULTIPLIERS at y={table_end_y:.0f}")
+            break
+    
+    return table_start_y, table_end_y
+
+
 def parse_floor_area_perimeter_data(page, page_text: str) -> Dict:
     """
     Parse floor area/perimeter multiplier data from page
     
     Returns dict with perimeter_values, floor_area_values, and multipliers list
     """
-    # Extract words with positions
     words = page.extract_words(x_tolerance=3, y_tolerance=3)
     
     # Find boundaries: FLOOR AREA/PERIMETER MULTIPLIERS to STORY HEIGHT MULTIPLIERS
-    table_start_y = None
-    table_end_y = None
-    
-    for word in words:
-        text = word['text'].upper()
-        if 'PERIMETER' in text:
-            nearby = [w for w in words if abs(w['top'] - word['top']) < 15]
-            nearby_text = ' '.join(w['text'].upper() for w in nearby)
-            if 'FLOOR' in nearby_text and 'MULTIPLIER' in nearby_text:
-                table_start_y = word['top']
-                print(f"   Found FLOOR AREA/PERIMETER MULTIPLIERS at y={table_start_y:.0f}")
-        
-        if text == 'STORY':
-            nearby = [w for w in words if abs(w['top'] - word['top']) < 10]
-            nearby_text = ' '.join(w['text'].upper() for w in nearby)
-            if 'HEIGHT' in nearby_text and 'MULTIPLIER' in nearby_text:
-                table_end_y = word['top']
-                print(f"   Found STORY HEIGHT MULTIPLIERS at y={table_end_y:.0f}")
-                break
+    table_start_y, table_end_y = find_table_bounds(page, words)
     
     if not table_start_y:
         print("   [!] Could not locate FLOOR AREA/PERIMETER header")
         return None
     
-    # Filter words to table region
-    table_words = []
-    for word in words:
-        if table_start_y and word['top'] > table_start_y + 20:
-            if table_end_y and word['top'] >= table_end_y - 10:
-                continue
-            table_words.append(word)
-    
-    # Group words by Y position (rows)
-    # First pass: collect words with their raw Y positions
-    rows_by_y = defaultdict(list)
-    for word in table_words:
-        y_key = round(word['top'])
-        rows_by_y[y_key].append(word)
-    
-    # Second pass: merge rows that are within 2px of each other
-    # This handles the case where floor area labels and multipliers have slight Y offsets
-    merged_rows = {}
-    sorted_y_keys = sorted(rows_by_y.keys())
-    
-    for y_key in sorted_y_keys:
-        # Find if there's an existing merged row within 3px
-        merged_to = None
-        for existing_y in merged_rows.keys():
-            if abs(y_key - existing_y) <= 3:
-                merged_to = existing_y
-                break
-        
-        if merged_to is not None:
-            merged_rows[merged_to].extend(rows_by_y[y_key])
-        else:
-            merged_rows[y_key] = list(rows_by_y[y_key])
-    
-    sorted_rows = sorted(merged_rows.items(), key=lambda x: x[0])
-    
-    # Known perimeter values (ft) from the table header
-    perimeter_values_ft = [160, 180, 200, 250, 300, 350, 400, 500, 600, 700, 800, 1000, 1200, 1400, 1600, 2000]
-    
-    # Known floor area values (sq ft) from the table
-    floor_area_values_ft = [1500, 2000, 2500, 3000, 4000, 5000, 6000, 7000, 8000, 9000, 
-                           10000, 12000, 14000, 16000, 18000, 20000, 24000, 28000, 
-                           32000, 36000, 40000]
+    return parse_table_words(table_band_words(words, table_start_y, table_end_y))
+
+
+def table_band_words(words: List[Dict], table_start_y: float, table_end_y: Optional[float]) -> List[Dict]:
+    """
+    Keep the words between the two headings, so neither heading nor the story
+    height table reaches the row grouping
     
-    # First, find the X positions of the perimeter column headers
+    A word belongs to the table by its top edge alone; a row sitting right above
+    the STORY HEIGHT heading is kept even if its bottom reaches into the margin.
+    """
+    region_top = table_start_y + 20
+    region_bottom = table_end_y - 10 if table_end_y else float('inf')
+    return [w for w in words if region_top < w['top'] < region_bottom]
+
+
+def row_floor_area(row_words: List[Dict]) -> Optional[int]:
+    """Floor area (sq ft) labelling an X-sorted row, or None"""
+    # Should be in left part of row; the table has Sq. M. column first, then Sq. Ft. column
+    for word in row_words[:5]:  # Check only first 5 words in row
+        text = word['text'].replace(',', '').strip()
+        if not _NUM_RE.fullmatch(text):
+            continue
+        num = float(text)
+        if num.is_integer() and int(num) in _FLOOR_AREA_SET:
+            return int(num)
+    return None
+
+
+def row_multiplier_candidates(row_words: List[Dict]) -> List[Tuple[float, float]]:
+    """(x0, value) of multiplier candidates (between 0.8 and 1.5) in an X-sorted row"""
+    candidates = []
+    for word in row_words:
+        text = word['text'].replace(',', '').strip()
+        # Dashes ("----") and labels fail the number check without raising
+        if not _NUM_RE.fullmatch(text):
+            continue
+        num = float(text)
+        if 0.8 <= num <= 1.5:
+            candidates.append((word['x0'], num))
+    return candidates
+
+
+def find_perimeter_columns(sorted_rows: List[Tuple[int, List[Dict]]]) -> Dict[int, float]:
+    """X positions of the perimeter column headers, keyed by perimeter (ft)"""
     # Look for the header row containing perimeter values
     perimeter_col_positions = {}
     for y_pos, row_words in sorted_rows[:5]:  # Check first few rows for header
         row_words_sorted = sorted(row_words, key=lambda w: w['x0'])
         for word in row_words_sorted:
             text = word['text'].replace(',', '').strip()
-            try:
-                num = int(float(text))
-                if num in perimeter_values_ft:
-                    perimeter_col_positions[num] = word['x0']
-            except ValueError:
+            if not _NUM_RE.fullmatch(text):
                 continue
+            num = float(text)
+            if num.is_integer() and int(num) in _PERIMETER_SET:
+                perimeter_col_positions[int(num)] = word['x0']
+    return perimeter_col_positions
+
+
+def parse_table_words(table_words: List[Dict]) -> Dict:
+    """
+    Build the multiplier matrix from the words inside the table region
+    
+    Returns dict with perimeter_values, floor_area_values, and multipliers list
+    """
+    # Group words into rows: one stable sort by rounded Y, then a single sweep that
+    # starts a new row whenever Y moves more than 3px past the current row's key.
+    # Merging nearby Ys handles floor area labels and multipliers with slight offsets.
+    sorted_rows = []
+    current_key = None
+    
+    for word in sorted(table_words, key=lambda w: round(w['top'])):
+        y_key = round(word['top'])
+        if current_key is not None and y_key - current_key <= 3:
+            sorted_rows[-1][1].append(word)
+        else:
+            current_key = y_key
+            sorted_rows.append((y_key, [word]))
     
+    # First, find the X positions of the perimeter column headers
+    perimeter_col_positions = find_perimeter_columns(sorted_rows)
     if perimeter_col_positions:
         print(f"   Found {len(perimeter_col_positions)} perimeter column positions")
     
-    multipliers = []
+    # Perimeter columns ordered by X for nearest-column matching
+    sorted_cols = sorted(perimeter_col_positions.items(), key=lambda kv: kv[1])
+    col_xs = [px for _, px in sorted_cols]
+    col_perimeters = [pval for pval, _ in sorted_cols]
+    
+    # Keyed by (floor_area, perimeter); the first value seen for a cell wins
+    multipliers = {}
     
     # Parse each row looking for floor area and multiplier values
     for y_pos, row_words in sorted_rows:
         row_words = sorted(row_words, key=lambda w: w['x0'])
         
-        # Find floor area value (should be in left part of row, within first ~80px)
-        # The table has Sq. M. column first, then Sq. Ft. column
-        floor_area_sqft = None
-        floor_area_x = None
-        
-        for word in row_words[:5]:  # Check only first 5 words in row
-            text = word['text'].replace(',', '').strip()
-            try:
-                num = int(float(text))
-                if num in floor_area_values_ft:
-                    floor_area_sqft = num
-                    floor_area_x = word['x0']
-                    break
-            except ValueError:
-                continue
-        
+        floor_area_sqft = row_floor_area(row_words)
         if not floor_area_sqft:
             continue
         
-        # Extract multiplier values based on X position
-        for word in row_words:
-            text = word['text'].replace(',', '').strip()
-            if text in ['---', '----', '--', '']:
-                continue
-            try:
-                num = float(text)
-                # Multipliers are between 0.8 and 1.5
-                if 0.8 <= num <= 1.5:
-                    # Find which perimeter column this belongs to based on X position
-                    word_x = word['x0']
-                    
-                    # Match to nearest perimeter column
-                    best_perimeter = None
-                    best_dist = float('inf')
-                    
-                    for pval, px in perimeter_col_positions.items():
-                        dist = abs(word_x - px)
-                        if dist < best_dist and dist < 40:  # Within 40 pixels
-                            best_dist = dist
-                            best_perimeter = pval
-                    
-                    if best_perimeter:
-                        multipliers.append({
-                            'floor_area_sqft': floor_area_sqft,
-                            'perimeter_ft': best_perimeter,
-                            'multiplier': round(num, 3)
-                        })
-            except ValueError:
-                continue
+        candidates = row_multiplier_candidates(row_words)
+        
+        # Assign candidates to their nearest perimeter column in one left-to-right
+        # sweep: both lists are sorted by X, so the column pointer only moves forward
+        i = 0
+        for word_x, num in candidates:
+            while i < len(col_xs) and col_xs[i] < word_x:
+                i += 1
+            
+            # Only the columns either side of the word can be closest
+            best_perimeter = None
+            best_dist = 40  # Within 40 pixels
+            for j in (i - 1, i):
+                if 0 <= j < len(col_xs):
+                    dist = abs(word_x - col_xs[j])
+                    if dist < best_dist:
+                        best_dist = dist
+                        best_perimeter = col_perimeters[j]
+            
+            if best_perimeter and (floor_area_sqft, best_perimeter) not in multipliers:
+                multipliers[(floor_area_sqft, best_perimeter)] = Multiplier(
+                    floor_area_sqft, best_perimeter, round(num, 3)
+                )
     
-    # Remove duplicates (same floor_area + perimeter combination)
-    seen = set()
-    unique_multipliers = []
-    for m in multipliers:
-        key = (m['floor_area_sqft'], m['perimeter_ft'])
-        if key not in seen:
-            seen.add(key)
-            unique_multipliers.append(m)
+    unique_multipliers = list(multipliers.values())
     
     if not unique_multipliers:
         return None
     
     return {
-        'perimeter_values': perimeter_values_ft,
-        'floor_area_values': floor_area_values_ft,
+        'perimeter_values': list(_PERIMETER_VALUES_FT),
+        'floor_area_values': list(_FLOOR_AREA_VALUES_FT),
         'multipliers': unique_multipliers
     }
 
 
 def save_to_json(results: Dict, output_path: str) -> None:
-    """Save parsed multipliers to JSON file"""
+    """Save parsed multipliers to JSON file (with orjson when it is installed)"""
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'metadata': {
-                'source': f"Marshall Valuation Service - Section {results['section']}, Page {results['section_page']}",
-                'pdf_page': results['pdf_page'],
-                'description': 'Floor area/perimeter multipliers - adjustments based on building size and shape',
-            },
-            'perimeter_values_ft': results['perimeter_values'],
-            'floor_area_values_sqft': results['floor_area_values'],
-            'multipliers': results['multipliers']
-        }, f, indent=2)
+    payload = {
+        'metadata': {
+            'source': f"Marshall Valuation Service - Section {results['section']}, Page {results['section_page']}",
+            'pdf_page': results['pdf_page'],
+            'description': 'Floor area/perimeter multipliers - adjustments based on building size and shape',
+        },
+        'perimeter_values_ft': results['perimeter_values'],
+        'floor_area_values_sqft': results['floor_area_values'],
+        'multipliers': results['multipliers']
+    }
+    
+    # Both serialize the Multiplier dataclasses directly; keys keep their written order
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, default=asdict)
     
     print(f"[SAVED] JSON: {output_file}")
 
 
-def save_to_markdown(results: Dict, output_path: str) -> None:
-    """Save parsed multipliers to markdown file"""
+def pivot_multipliers(multipliers: List[Multiplier]) -> Dict[int, Dict[int, float]]:
+    """Pivot multipliers to floor area -> perimeter -> multiplier"""
+    by_area = defaultdict(dict)
+    for m in multipliers:
+        by_area[m.floor_area_sqft][m.perimeter_ft] = m.multiplier
+    return by_area
+
+
+def save_to_markdown(results: Dict, output_path: str, by_area: Optional[Dict[int, Dict[int, float]]] = None) -> None:
+    """
+    Save parsed multipliers to markdown file
+    
+    by_area is the pivot_multipliers() view of results['multipliers']; it is
+    built here when the caller has not already computed it.
+    """
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
@@ -297,40 +474,41 @@ def save_to_markdown(results: Dict, output_path: str) -> None:
     perimeter_values = results['perimeter_values']
     floor_area_values = results['floor_area_values']
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(f"# FLOOR AREA/PERIMETER MULTIPLIERS - Section {section}\n\n")
-        f.write(f"**Source:** Marshall Valuation Service, Section {section}, Page {section_page}\n")
-        f.write(f"**PDF Page:** {pdf_page}\n\n")
-        f.write("*Multipliers adjust base cost based on floor area and perimeter dimensions*\n\n")
+    lines = [
+        f"# FLOOR AREA/PERIMETER MULTIPLIERS - Section {section}\n\n",
+        f"**Source:** Marshall Valuation Service, Section {section}, Page {section_page}\n",
+        f"**PDF Page:** {pdf_page}\n\n",
+        "*Multipliers adjust base cost based on floor area and perimeter dimensions*\n\n",
+    ]
+    
+    if multipliers:
+        # Create a matrix view grouped by floor area
+        lines.append("## Multiplier Table\n\n")
         
-        if multipliers:
-            # Create a matrix view grouped by floor area
-            f.write("## Multiplier Table\n\n")
-            
-            # Header row with perimeter values
-            header = "| Floor Area (SF) |"
+        # Header row with perimeter values
+        lines.append("| Floor Area (SF) |" + "".join(f" {p} |" for p in perimeter_values) + "\n")
+        
+        # Separator row
+        lines.append("| --- |" + " --- |" * len(perimeter_values) + "\n")
+        
+        if by_area is None:
+            by_area = pivot_multipliers(multipliers)
+        
+        # Data rows grouped by floor area
+        for area in floor_area_values:
+            area_mults = by_area.get(area, {})
+            row = f"| {area:,} |"
             for p in perimeter_values:
-                header += f" {p} |"
-            f.write(header + "\n")
-            
-            # Separator row
-            sep = "| --- |"
-            for _ in perimeter_values:
-                sep += " --- |"
-            f.write(sep + "\n")
-            
-            # Data rows grouped by floor area
-            for area in floor_area_values:
-                row = f"| {area:,} |"
-                area_mults = {m['perimeter_ft']: m['multiplier'] for m in multipliers if m['floor_area_sqft'] == area}
-                for p in perimeter_values:
-                    if p in area_mults:
-                        row += f" {area_mults[p]:.3f} |"
-                    else:
-                        row += " --- |"
-                f.write(row + "\n")
-        else:
-            f.write("*No multipliers extracted*\n")
+                if p in area_mults:
+                    row += f" {area_mults[p]:.3f} |"
+                else:
+                    row += " --- |"
+            lines.append(row + "\n")
+    else:
+        lines.append("*No multipliers extracted*\n")
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
     
     print(f"[SAVED] Markdown: {output_file}")
 
@@ -339,41 +517,54 @@ def main():
     """
     Main entry point for command-line usage
     
-    Usage: python parse-area-perimeter-multiplier.py <pdf_path> <pdf_page>
-    Example: python parse-area-perimeter-multiplier.py data/pdfs/MVS.pdf 90
+    Usage: python -m app.parsers.floor_area_perimeter_original <pdf_path> <pdf_page> [<pdf_page> ...]
+    Example: python -m app.parsers.floor_area_perimeter_original data/pdfs/MVS.pdf 90 217 214 215
     """
     if len(sys.argv) < 3:
-        print("Usage: python parse-area-perimeter-multiplier.py <pdf_path> <pdf_page>")
-        print("Example: python parse-area-perimeter-multiplier.py data/pdfs/MVS.pdf 90")
-        print("\nExtracts floor area/perimeter multiplier table from the specified PDF page.")
+        print("Usage: python -m app.parsers.floor_area_perimeter_original <pdf_path> <pdf_page> [<pdf_page> ...]")
+        print("Example: python -m app.parsers.floor_area_perimeter_original data/pdfs/MVS.pdf 90 217 214 215")
+        print("\nExtracts floor area/perimeter multiplier tables from the specified PDF pages.")
         print("Output files are named by section (e.g., S11_FLOOR_AREA_PERIMETER.md)")
         sys.exit(1)
     
     pdf_path = sys.argv[1]
-    pdf_page = int(sys.argv[2])
+    pdf_pages = [int(arg) for arg in sys.argv[2:]]
     
-    # Parse the PDF page
-    results = parse_area_perimeter_table(pdf_path, pdf_page)
+    # Parse the requested pages in parallel worker processes
+    all_results = parse_area_perimeter_tables_parallel(pdf_path, pdf_pages)
     
-    if results['success'] and results['section']:
-        # Save output with section-based naming
-        output_dir = Path(__file__).parent.parent / "Tables" / "Refinements" / "FloorAreaPerimeter"
-        section = results['section']
-        
-        # Save as markdown
-        markdown_path = output_dir / f"S{section}_FLOOR_AREA_PERIMETER.md"
-        save_to_markdown(results, str(markdown_path))
-        
-        # Save as JSON
-        json_path = output_dir / f"S{section}_floor_area_perimeter.json"
-        save_to_json(results, str(json_path))
-        
-        print(f"\n[SUCCESS] Section {section} floor area/perimeter multipliers extracted!")
-        print(f"   Total entries: {len(results['multipliers'])}")
-    else:
-        print("\n[ERROR] Processing failed!")
-        for error in results['errors']:
-            print(f"   - {error}")
+    output_dir = Path(__file__).parent.parent / "Tables" / "Refinements" / "FloorAreaPerimeter"
+    section_counts = Counter(results['section'] for results in all_results)
+    failed = False
+    
+    for results in all_results:
+        if results['success'] and results['section']:
+            # Save output with section-based naming
+            section = results['section']
+            
+            # Sections with several FA/P tables (e.g., S14) also get the section page in the name
+            prefix = f"S{section}"
+            if section_counts[section] > 1:
+                prefix += f"_P{results['section_page']}"
+            
+            # Save as markdown, from the pivot built once for this table
+            by_area = pivot_multipliers(results['multipliers'])
+            markdown_path = output_dir / f"{prefix}_FLOOR_AREA_PERIMETER.md"
+            save_to_markdown(results, str(markdown_path), by_area)
+            
+            # Save as JSON (flat multiplier list)
+            json_path = output_dir / f"{prefix}_floor_area_perimeter.json"
+            save_to_json(results, str(json_path))
+            
+            print(f"\n[SUCCESS] Section {section} floor area/perimeter multipliers extracted!")
+            print(f"   Total entries: {len(results['multipliers'])}")
+        else:
+            failed = True
+            print(f"\n[ERROR] Processing failed for PDF page {results['pdf_page']}!")
+            for error in results['errors']:
+                print(f"   - {error}")
+    
+    if failed:
         sys.exit(1)
 
 
@@ -3,6 +3,7 @@ Local Multiplier Parser - Database Integration Wrapper
 Uses the original MVS_Agent parser logic and writes to PostgreSQL
 """
 
+from dataclasses import asdict
 from typing import List, Dict
 from sqlalchemy.orm import Session
 from app.database import LocalMultiplier
@@ -18,7 +19,8 @@ from app.parsers.local_multipliers_original import (
 )
 
 
-def parse_and_save(pdf_path: str, db: Session, start_page: int = 719, end_page: int = 724, pdf_version_id: int = None) -> int:
+def parse_and_save(pdf_path: str, db: Session, start_page: int = 719, end_page: int = 724, pdf_version_id: int = None,
+                   force_refresh: bool = False) -> int:
     """
     Parse local multipliers from PDF using original parser and save to database.
     Version-isolated: only touches rows with the given pdf_version_id.
@@ -29,6 +31,7 @@ def parse_and_save(pdf_path: str, db: Session, start_page: int = 719, end_page:
         start_page: Starting page (1-indexed), default 719
         end_page: Ending page (1-indexed), default 724
         pdf_version_id: PDF version ID to scope all writes to
+        force_refresh: Re-parse the PDF instead of using cached parser results
     
     Returns:
         Number of records updated
@@ -37,7 +40,7 @@ def parse_and_save(pdf_path: str, db: Session, start_page: int = 719, end_page:
     print(f"[LocalMultipliers] Pages {start_page} to {end_page}, version_id={pdf_version_id}")
     
     # Use the original parser
-    results = parse_local_multiplier_table(pdf_path, start_page, end_page)
+    results = parse_local_multiplier_table(pdf_path, start_page, end_page, force_refresh=force_refresh)
     
     if not results['success']:
         raise Exception(f"Parser failed: {results['errors']}")
@@ -47,26 +50,19 @@ def parse_and_save(pdf_path: str, db: Session, start_page: int = 719, end_page:
     
     # Version-isolated: only delete rows for THIS version, then insert in one transaction
     if pdf_version_id:
-        deleted = db.query(LocalMultiplier).filter(LocalMultiplier.pdf_version_id == pdf_version_id).delete()
+        # No session objects to reconcile, so skip synchronize_session. TRUNCATE is not an
+        # option here: the table holds every version's rows.
+        deleted = db.query(LocalMultiplier).filter(
+            LocalMultiplier.pdf_version_id == pdf_version_id
+        ).delete(synchronize_session=False)
         print(f"[LocalMultipliers] Cleared {deleted} existing records for version {pdf_version_id}")
     
-    # Save to database
-    for m in multipliers:
-        record = LocalMultiplier(
-            location=m['location'],
-            city=m.get('city'),
-            region=m['region'],
-            country=m['country'],
-            class_a=m['class_a'],
-            class_b=m['class_b'],
-            class_c=m['class_c'],
-            class_d=m['class_d'],
-            class_s=m['class_s'],
-            source_page=m['source_page'],
-            is_regional=m.get('is_regional', False),
-            pdf_version_id=pdf_version_id,
-        )
-        db.add(record)
+    # Save to database in a single bulk INSERT rather than one ORM object per row
+    rows = [
+        dict(asdict(m), pdf_version_id=pdf_version_id)
+        for m in multipliers
+    ]
+    db.bulk_insert_mappings(LocalMultiplier, rows)
     
     db.commit()
     print(f"[LocalMultipliers] Saved {len(multipliers)} records for version {pdf_version_id}")
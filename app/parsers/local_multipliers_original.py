@@ -7,23 +7,177 @@ Pages 719-724 in current PDF (may vary by version).
 """
 
 import pdfplumber
+import hashlib
 import json
+import logging
+import mmap
+import os
+import re
+import shutil
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, asdict
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
-def parse_local_multiplier_table(pdf_path: str, start_page: int, end_page: int) -> Dict:
+from app.parsers.cache import CACHE_DIR, load_json, pdf_sha256, write_json_atomic
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Multiplier:
+    """A single local multiplier entry (a region/province or a city within it)"""
+    location: str
+    city: Optional[str]
+    region: Optional[str]
+    country: str
+    class_a: float
+    class_b: float
+    class_c: float
+    class_d: float
+    class_s: float
+    source_page: int
+    is_regional: bool
+
+
+# Parsed results are cached under CACHE_DIR by PDF content (MVS PDFs only change
+# quarterly), so re-running on an unchanged PDF skips pdfplumber entirely. The
+# version is part of every cache key; bump it when a change alters parsed output
+# so cached results from the older parser are not reused.
+PARSER_VERSION = 1
+
+
+# extract_tables() settings, shared by every page
+_TABLE_SETTINGS = {
+    "vertical_strategy": "lines_strict",
+    "horizontal_strategy": "lines_strict",
+    "explicit_vertical_lines": [],
+    "explicit_horizontal_lines": [],
+    "snap_tolerance": 3,
+    "join_tolerance": 3,
+    "edge_min_length": 3,
+    "min_words_vertical": 1,
+    "min_words_horizontal": 1,
+    "intersection_tolerance": 3,
+}
+
+# Region/province names recognised as regions even when not printed in all caps
+_KNOWN_REGIONS = frozenset({
+    'ALBERTA', 'BRITISH COLUMBIA', 'ONTARIO', 'QUEBEC', 'MANITOBA', 'SASKATCHEWAN',
+    'YUKON', 'NORTHWEST TERRITORY', 'GUAM', 'PUERTO RICO', 'VIRGIN ISLANDS',
+})
+
+# US territories listed among the non-US regions (matched as substrings of a region name)
+_US_TERRITORIES = frozenset({'GUAM', 'PUERTO RICO', 'VIRGIN ISLANDS', 'VIRGIN ISLANDS (U.S.)'})
+
+# Keywords marking a subsection of a region (e.g. "NEW YORK CITY AREA")
+_SUBSECTION_KEYWORDS = ('AREA', 'REGION', 'DISTRICT')
+
+# Patterns used on every line of every column, compiled once
+_RE_CAP_LOWER = re.compile(r'\b([A-Z])\s+([a-z])')
+_RE_CAP_CAP = re.compile(r'\b([A-Z])\s+([A-Z])')
+_RE_NUM_DOTNUM = re.compile(r'(\d)\s+(\.\d+)')
+_RE_DOT_NUM = re.compile(r'(\d\.)\s+(\d+)')
+_RE_LETTER_DIGIT = re.compile(r'([A-Za-z])(\d)')
+# Matches wherever any of the clean_text_spacing() substitutions would apply
+_RE_NEEDS_CLEANING = re.compile('|'.join(
+    p.pattern for p in (_RE_CAP_LOWER, _RE_CAP_CAP, _RE_NUM_DOTNUM, _RE_DOT_NUM, _RE_LETTER_DIGIT)
+))
+_RE_SKIP_SHORT = re.compile(r'\b(GST|PST|HST|CLASS|PAGE)\b')
+
+# "(CONTINUED)" / "(Continued)" suffix on a region carried over from the previous column
+_RE_CONTINUED = re.compile(r'\(continued\)', re.IGNORECASE)
+
+# A decimal number as float() reads it; checked with fullmatch() before calling
+# float() so labels never go through a raised-and-caught ValueError
+_RE_NUMBER = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+# Splits a line into whitespace-separated tokens and classifies them in one pass:
+# group 1 is set for a whole-token decimal number, group 2 for anything else
+_RE_TOKEN = re.compile(rf'(?<!\S)(?:({_RE_NUMBER.pattern})(?!\S)|(\S+))')
+
+# Header/footer and tax table phrases, one alternation per parser so each line
+# is scanned once instead of once per phrase
+_RE_SKIP_PHRASE = re.compile(r'LOCAL MULTIPLIER|SECTION 99|MARSHALL|APPLY TO|TAX REMOVAL|DEDUCTION|EXAMPLE:|CANADA|UNITED STATES')
+_RE_TABLE_SKIP = re.compile(r'CLASS|MULTIPLIER|APPLY TO|TAX REMOVAL|DEDUCTION|EXAMPLE:')
+_RE_TEXT_SKIP = re.compile(r'LOCAL MULTIPLIER|SECTION 99|PAGE|MARSHALL|APPLY TO|TAX REMOVAL|DEDUCTION|EXAMPLE:|GST|PST|HST')
+
+
+def load_cached_results(cache_path: Path) -> Optional[Dict]:
+    """Results dict saved by an earlier run, or None"""
+    results = load_json(cache_path)
+    try:
+        results['multipliers'] = [Multiplier(**m) for m in results['multipliers']]
+        return results
+    except (TypeError, KeyError):
+        return None
+
+
+def save_cached_results(cache_path: Path, results: Dict) -> None:
+    """Save a results dict for later runs; failures only cost the cache"""
+    try:
+        write_json_atomic(cache_path, results, default=asdict)
+    except OSError as e:
+        logger.warning("Could not write results cache: %s", e)
+
+
+def page_cache_path(pdf_sha: str, page_num: int, page_text: str) -> Path:
+    """Per-page cache file, keyed on the parser version and the page's own text as well as the PDF hash"""
+    page_hash = hashlib.md5((pdf_sha + str(page_num) + page_text).encode()).hexdigest()
+    return CACHE_DIR / "pages" / pdf_sha / f"v{PARSER_VERSION}_{page_num}_{page_hash}.json"
+
+
+def clear_page_cache(pdf_sha: Optional[str] = None) -> None:
+    """Remove cached per-page results for one PDF (by SHA-256), or for all PDFs"""
+    pages_dir = CACHE_DIR / "pages"
+    shutil.rmtree(pages_dir / pdf_sha if pdf_sha else pages_dir, ignore_errors=True)
+
+
+def parse_local_multiplier_table(pdf_path: str, start_page: int, end_page: int, force_refresh: bool = False,
+                                 max_workers: int = 1, pdf=None, pdf_sha: Optional[str] = None) -> Dict:
     """
     Parse local multiplier tables from specified page range
     
+    Results are cached under ~/.cache/mvs_parser keyed by PARSER_VERSION, the
+    PDF's SHA-256 and the page range; a cached run returns without opening the PDF.
+    
     Args:
         pdf_path: Path to MVS PDF file
         start_page: Starting page number (1-indexed for user, converted to 0-indexed)
         end_page: Ending page number (1-indexed)
+        force_refresh: Re-parse the PDF even if cached results exist
+        max_workers: Worker processes for the pages (default 1 parses in this
+                     process; the command line opts into a pool)
+        pdf: Already-open pdfplumber PDF to parse instead of opening pdf_path again;
+             its pages are parsed in this process
+        pdf_sha: SHA-256 of the PDF when the caller already knows it
     
     Returns:
         Dictionary containing parsed multiplier data and metadata
     """
+    cache_path = None
+    try:
+        pdf_sha = pdf_sha or pdf_sha256(pdf_path)
+        cache_path = CACHE_DIR / f"v{PARSER_VERSION}_{pdf_sha}_{start_page}_{end_page}.json"
+    except OSError:
+        pass  # An unreadable PDF is reported by the parse below
+    
+    if cache_path is not None and not force_refresh:
+        cached = load_cached_results(cache_path)
+        if cached is not None:
+            cached['metadata']['source_file'] = str(pdf_path)
+            logger.info("Using cached results for pages %d to %d: %s", start_page, end_page, cache_path.name)
+            return cached
+    
     results = {
         'success': False,
         'multipliers': [],
@@ -36,66 +190,198 @@ def parse_local_multiplier_table(pdf_path: str, start_page: int, end_page: int)
     }
     
     try:
-        print(f"[*] Opening PDF: {pdf_path}")
-        print(f"[*] Processing pages {start_page} to {end_page}")
+        logger.info("Processing pages %d to %d", start_page, end_page)
         
-        with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            
-            # Validate page range
-            if start_page < 1 or end_page > total_pages:
-                raise ValueError(f"Invalid page range. PDF has {total_pages} pages.")
-            
-            # Convert to 0-indexed
-            start_idx = start_page - 1
-            end_idx = end_page
-            
-            multipliers = []
-            
-            for page_num in range(start_idx, end_idx):
-                page = pdf.pages[page_num]
-                display_page = page_num + 1
-                
-                print(f"\n[*] Processing page {display_page}...")
-                
-                # Extract text for analysis
-                page_text = page.extract_text()
-                
-                # TODO: Implement table parsing logic
-                # This will be filled in after you provide sample data
-                page_multipliers = parse_page_multipliers(page, page_text, display_page)
-                
-                if page_multipliers:
-                    multipliers.extend(page_multipliers)
-                    print(f"   [+] Found {len(page_multipliers)} multiplier entries")
-                else:
-                    print(f"   [!] No multipliers found on page {display_page}")
-            
-            # Store results
-            results['success'] = True
-            results['multipliers'] = multipliers
-            results['metadata']['total_entries'] = len(multipliers)
-            
-            print(f"\n[SUCCESS] Parsing complete!")
-            print(f"   Total multipliers extracted: {len(multipliers)}")
+        if pdf is not None:
+            multipliers = parse_page_range(pdf, pdf_path, start_page, end_page, pdf_sha, force_refresh, max_workers=1)
+        else:
+            logger.info("Opening PDF: %s", pdf_path)
             
+            # Parse from a memory map of the file so pdfminer's many small reads hit
+            # memory instead of issuing a read syscall each
+            with open(pdf_path, 'rb') as fh, \
+                    mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf, \
+                    pdfplumber.open(buf) as opened_pdf:
+                multipliers = parse_page_range(opened_pdf, pdf_path, start_page, end_page, pdf_sha, force_refresh, max_workers)
+        
+        # Store results
+        results['success'] = True
+        results['multipliers'] = multipliers
+        results['metadata']['total_entries'] = len(multipliers)
+        
+        logger.info("Parsing complete, %d multipliers extracted", len(multipliers))
+        
+        if cache_path is not None:
+            save_cached_results(cache_path, results)
+        
     except FileNotFoundError:
         error_msg = f"PDF file not found: {pdf_path}"
-        print(f"[ERROR] {error_msg}")
+        logger.error(error_msg)
         results['errors'].append(error_msg)
     except ValueError as e:
         error_msg = str(e)
-        print(f"[ERROR] {error_msg}")
+        logger.error(error_msg)
         results['errors'].append(error_msg)
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
-        print(f"[ERROR] {error_msg}")
+        logger.error(error_msg)
         results['errors'].append(error_msg)
     
     return results
 
 
-def parse_page_multipliers(page, page_text: str, page_num: int) -> List[Dict]:
+def parse_page_range(pdf, pdf_path: str, start_page: int, end_page: int, pdf_sha: Optional[str] = None,
+                     force_refresh: bool = False, max_workers: int = 1) -> List[Multiplier]:
+    """
+    Parse a page range of an open PDF, in worker processes unless max_workers is 1
+    
+    Returns:
+        List of Multiplier entries in page order
+    """
+    total_pages = len(pdf.pages)
+    
+    # Validate page range
+    if start_page < 1 or end_page > total_pages:
+        raise ValueError(f"Invalid page range. PDF has {total_pages} pages.")
+    
+    page_nums = range(start_page, end_page + 1)
+    max_workers = min(max_workers, len(page_nums))
+    
+    if max_workers > 1:
+        # Pages share no state, so they parse in separate processes (pdfminer
+        # is pure Python and holds the GIL); map() keeps page order
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            page_results = list(executor.map(
+                partial(parse_one_page, pdf_path, pdf_sha=pdf_sha, force_refresh=force_refresh),
+                page_nums
+            ))
+    else:
+        page_results = [
+            parse_pdf_page(pdf.pages[page_num - 1], page_num, pdf_sha, force_refresh)
+            for page_num in page_nums
+        ]
+    
+    return [m for page_multipliers in page_results for m in page_multipliers]
+
+
+class LocalMultiplierParser:
+    """
+    Keeps one MVS PDF open across several page-range parses
+    
+    The file is memory-mapped, loaded by pdfplumber and hashed once, instead of
+    on every parse_local_multiplier_table() call.
+    
+    Usage:
+        with LocalMultiplierParser(pdf_path) as parser:
+            canada = parser.parse(719, 720)
+            territories = parser.parse(721, 724)
+    """
+    
+    def __init__(self, pdf_path: str):
+        self.pdf_path = pdf_path
+        self.pdf_sha = pdf_sha256(pdf_path)
+        # If mmap or pdfplumber fails, the stack closes whatever was already opened
+        with ExitStack() as stack:
+            fh = stack.enter_context(open(pdf_path, 'rb'))
+            buf = stack.enter_context(mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ))
+            self._pdf = stack.enter_context(pdfplumber.open(buf))
+            self._resources = stack.pop_all()
+    
+    def parse(self, start_page: int, end_page: int, force_refresh: bool = False) -> Dict:
+        """Parse a page range; same result dictionary as parse_local_multiplier_table()"""
+        return parse_local_multiplier_table(self.pdf_path, start_page, end_page, force_refresh,
+                                            pdf=self._pdf, pdf_sha=self.pdf_sha)
+    
+    def close(self) -> None:
+        self._resources.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def parse_one_page(pdf_path: str, page_num: int, pdf_sha: Optional[str] = None, force_refresh: bool = False) -> List[Multiplier]:
+    """
+    Open the PDF and parse a single page; the unit of work for worker processes
+    
+    pdfplumber only loads the requested page, not the whole page tree.
+    
+    Args:
+        pdf_path: Path to MVS PDF file
+        page_num: Page number (1-indexed)
+        pdf_sha: SHA-256 of the PDF, enables the per-page cache
+        force_refresh: Re-parse the page even if it is cached
+    
+    Returns:
+        List of Multiplier entries
+    """
+    with open(pdf_path, 'rb') as fh, \
+            mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf, \
+            pdfplumber.open(buf, pages=[page_num]) as pdf:
+        return parse_pdf_page(pdf.pages[0], page_num, pdf_sha, force_refresh)
+
+
+def parse_pdf_page(page, page_num: int, pdf_sha: Optional[str] = None, force_refresh: bool = False) -> List[Multiplier]:
+    """Extract the text of an open page and parse its multiplier entries"""
+    logger.info("Processing page %d", page_num)
+    
+    # Extract text for analysis
+    page_text = page.extract_text()
+    
+    page_multipliers = parse_page_multipliers(page, page_text, page_num, pdf_sha, force_refresh)
+    
+    # pdf.pages keeps every Page alive until the PDF is closed; drop this page's
+    # parsed chars/lines/rects now so long page ranges don't hold them all
+    page.flush_cache()
+    
+    if page_multipliers:
+        logger.info("   Found %d multiplier entries", len(page_multipliers))
+    else:
+        logger.warning("   No multipliers found on page %d", page_num)
+    
+    return page_multipliers
+
+
+def parse_page_multipliers(page, page_text: str, page_num: int, pdf_sha: Optional[str] = None, force_refresh: bool = False) -> List[Multiplier]:
+    """
+    Parse multiplier entries from a single page, reusing the cached entries
+    for this page when pdf_sha is given and the page text is unchanged
+    
+    Args:
+        page: pdfplumber page object
+        page_text: Extracted text from page
+        page_num: Page number (1-indexed)
+        pdf_sha: SHA-256 of the PDF, enables the per-page cache
+        force_refresh: Re-parse the page even if it is cached
+    
+    Returns:
+        List of Multiplier entries
+    """
+    if pdf_sha is None:
+        return extract_page_multipliers(page, page_text, page_num)
+    
+    cache_path = page_cache_path(pdf_sha, page_num, page_text)
+    if not force_refresh:
+        cached = load_json(cache_path)
+        try:
+            if isinstance(cached, list):
+                return [Multiplier(**m) for m in cached]
+        except Exception:
+            pass  # Stale-format entry: re-parse the page
+    
+    multipliers = extract_page_multipliers(page, page_text, page_num)
+    
+    try:
+        write_json_atomic(cache_path, multipliers, default=asdict)
+    except OSError as e:
+        logger.warning("Could not write page cache: %s", e)
+    
+    return multipliers
+
+
+def extract_page_multipliers(page, page_text: str, page_num: int) -> List[Multiplier]:
     """
     Parse multiplier entries from a single page
     
@@ -110,41 +396,28 @@ def parse_page_multipliers(page, page_text: str, page_num: int) -> List[Dict]:
         page_num: Page number (1-indexed)
     
     Returns:
-        List of multiplier dictionaries
+        List of Multiplier entries
     """
     multipliers = []
     
     # Try table extraction with more lenient settings
-    table_settings = {
-        "vertical_strategy": "lines_strict",
-        "horizontal_strategy": "lines_strict",
-        "explicit_vertical_lines": [],
-        "explicit_horizontal_lines": [],
-        "snap_tolerance": 3,
-        "join_tolerance": 3,
-        "edge_min_length": 3,
-        "min_words_vertical": 1,
-        "min_words_horizontal": 1,
-        "intersection_tolerance": 3,
-    }
-    
-    tables = page.extract_tables(table_settings)
+    tables = page.extract_tables(_TABLE_SETTINGS)
     
     if tables and any(len(table) > 3 for table in tables):  # At least one table with data
-        print(f"   Found {len(tables)} table(s) on page")
+        logger.debug("   Found %d table(s) on page", len(tables))
         for table_idx, table in enumerate(tables):
             table_multipliers = parse_table_data(table, page_num)
             multipliers.extend(table_multipliers)
-            print(f"   Table {table_idx + 1}: Extracted {len(table_multipliers)} entries")
+            logger.debug("   Table %d: Extracted %d entries", table_idx + 1, len(table_multipliers))
     else:
         # Use position-based text extraction to preserve spatial layout
-        print(f"   Using position-based text extraction")
-        multipliers = parse_position_based_text(page, page_num)
+        logger.debug("   Using position-based text extraction")
+        multipliers = parse_position_based_text(page, page_num, page_text)
     
     return multipliers
 
 
-def parse_table_data(table: List[List[str]], page_num: int) -> List[Dict]:
+def parse_table_data(table: List[List[str]], page_num: int) -> List[Multiplier]:
     """
     Parse multipliers from extracted table data
     
@@ -160,13 +433,16 @@ def parse_table_data(table: List[List[str]], page_num: int) -> List[Dict]:
     current_country = "Unknown"
     
     # Determine country from context (check for CANADA, USA, etc. in headers)
-    for row in table[:5]:  # Check first few rows for headers
+    # The last header row that names a country wins, so scan backwards and stop at the first
+    for row in reversed(table[:5]):  # Check first few rows for headers
         if row and any(cell for cell in row if cell):
-            row_text = ' '.join([str(c or '') for c in row]).upper()
+            row_text = ' '.join(str(c or '') for c in row).upper()
             if 'CANADA' in row_text:
                 current_country = "Canada"
+                break
             elif 'UNITED STATES' in row_text or 'U.S.' in row_text:
                 current_country = "United States"
+                break
     
     for row in table:
         if not row or not any(row):
@@ -178,16 +454,12 @@ def parse_table_data(table: List[List[str]], page_num: int) -> List[Dict]:
         # Join row text for exclusion checks
         row_text = ' '.join(cleaned).upper()
         
-        # Skip header rows
-        if any(keyword in row_text for keyword in ['CLASS', 'MULTIPLIER', 'APPLY TO']):
+        # Skip header rows and tax removal table rows (contains percentages)
+        if _RE_TABLE_SKIP.search(row_text):
             continue
         
-        # Skip tax removal table rows (contains percentages)
-        if any(keyword in row_text for keyword in ['TAX REMOVAL', 'DEDUCTION', 'EXAMPLE:']):
-            continue
-        
-        # Skip rows with percentage signs (tax table)
-        if '%' in row_text or any('%' in str(cell) for cell in cleaned):
+        # Skip rows with percentage signs (tax table); row_text holds every cell
+        if '%' in row_text:
             continue
         
         # Look for location name and multiplier values
@@ -200,21 +472,17 @@ def parse_table_data(table: List[List[str]], page_num: int) -> List[Dict]:
         # Extract multiplier values (last 5 columns should be A, B, C, D, S)
         multiplier_values = []
         for cell in cleaned[1:]:
-            try:
-                # Skip cells with percentage signs
-                if '%' in str(cell):
-                    continue
-                    
-                # Try to convert to float - these are the multiplier values
-                val = float(cell)
-                
-                # Multipliers should be between 0.5 and 2.5 (reasonable range)
-                # Tax percentages would be 5.0+, so exclude those
-                if 0.5 <= val <= 2.5:
-                    multiplier_values.append(val)
-            except (ValueError, TypeError):
-                # Not a number, might be part of location name or other text
+            # Only plain numbers are multiplier candidates; text (part of a location
+            # name or other labels) and percentages are skipped without calling float()
+            if not _RE_NUMBER.fullmatch(cell):
                 continue
+            
+            val = float(cell)
+            
+            # Multipliers should be between 0.5 and 2.5 (reasonable range)
+            # Tax percentages would be 5.0+, so exclude those
+            if 0.5 <= val <= 2.5:
+                multiplier_values.append(val)
         
         # We expect exactly 5 multipliers (A, B, C, D, S)
         if len(multiplier_values) >= 5:
@@ -222,39 +490,39 @@ def parse_table_data(table: List[List[str]], page_num: int) -> List[Dict]:
             class_multipliers = multiplier_values[-5:]
             
             # Determine if this is a region/province or a city
-            is_region = location_name.isupper() or location_name in ['ALBERTA', 'BRITISH COLUMBIA', 'ONTARIO', 'QUEBEC', 'MANITOBA', 'SASKATCHEWAN', 'YUKON', 'NORTHWEST TERRITORY', 'GUAM', 'PUERTO RICO', 'VIRGIN ISLANDS']
+            is_region = location_name.isupper() or location_name in _KNOWN_REGIONS
             
             if is_region:
                 current_region = location_name
                 # Add region-level entry
-                multipliers.append({
-                    'location': location_name,
-                    'city': None,
-                    'region': location_name,
-                    'country': current_country,
-                    'class_a': class_multipliers[0],
-                    'class_b': class_multipliers[1],
-                    'class_c': class_multipliers[2],
-                    'class_d': class_multipliers[3],
-                    'class_s': class_multipliers[4],
-                    'source_page': page_num,
-                    'is_regional': True,
-                })
+                multipliers.append(Multiplier(
+                    location=location_name,
+                    city=None,
+                    region=location_name,
+                    country=current_country,
+                    class_a=class_multipliers[0],
+                    class_b=class_multipliers[1],
+                    class_c=class_multipliers[2],
+                    class_d=class_multipliers[3],
+                    class_s=class_multipliers[4],
+                    source_page=page_num,
+                    is_regional=True,
+                ))
             else:
                 # This is a city under the current region
-                multipliers.append({
-                    'location': f"{location_name}, {current_region}" if current_region else location_name,
-                    'city': location_name,
-                    'region': current_region,
-                    'country': current_country,
-                    'class_a': class_multipliers[0],
-                    'class_b': class_multipliers[1],
-                    'class_c': class_multipliers[2],
-                    'class_d': class_multipliers[3],
-                    'class_s': class_multipliers[4],
-                    'source_page': page_num,
-                    'is_regional': False,
-                })
+                multipliers.append(Multiplier(
+                    location=f"{location_name}, {current_region}" if current_region else location_name,
+                    city=location_name,
+                    region=current_region,
+                    country=current_country,
+                    class_a=class_multipliers[0],
+                    class_b=class_multipliers[1],
+                    class_c=class_multipliers[2],
+                    class_d=class_multipliers[3],
+                    class_s=class_multipliers[4],
+                    source_page=page_num,
+                    is_regional=False,
+                ))
     
     return multipliers
 
@@ -266,65 +534,73 @@ def clean_text_spacing(text: str) -> str:
     Also separates text from numbers: "TERRITORY1.53" -> "TERRITORY 1.53"
     Joins broken numbers: "1 .01" -> "1.01", "0 .96" -> "0.96"
     """
-    import re
+    # Most lines need none of the fixes below: one scan for all five patterns
+    # lets them skip the chain of substitutions entirely
+    if not _RE_NEEDS_CLEANING.search(text):
+        return text
+    
     # Remove spaces between single capital letters and following text
     # This handles cases like "M ARITIMES", "Y armouth", etc.
-    text = re.sub(r'\b([A-Z])\s+([a-z])', r'\1\2', text)
-    text = re.sub(r'\b([A-Z])\s+([A-Z])', r'\1\2', text)
+    text = _RE_CAP_LOWER.sub(r'\1\2', text)
+    text = _RE_CAP_CAP.sub(r'\1\2', text)
     
     # Join broken decimal numbers: "1 .01" -> "1.01", "0 .96" -> "0.96"
     # This handles PDF extraction issues where numbers are split
-    text = re.sub(r'(\d)\s+(\.\d+)', r'\1\2', text)
+    text = _RE_NUM_DOTNUM.sub(r'\1\2', text)
     
     # Join broken decimal numbers with period-space: "1. 02" -> "1.02"
     # This handles another PDF extraction pattern
-    text = re.sub(r'(\d\.)\s+(\d+)', r'\1\2', text)
+    text = _RE_DOT_NUM.sub(r'\1\2', text)
     
     # Separate text from numbers that are stuck together
     # e.g., "TERRITORY1.53" -> "TERRITORY 1.53"
-    text = re.sub(r'([A-Za-z])(\d)', r'\1 \2', text)
+    text = _RE_LETTER_DIGIT.sub(r'\1 \2', text)
     
     return text
 
 
+@lru_cache(maxsize=256)
 def get_country_for_region(region_name: str, default_country: str) -> str:
     """
     Determine the correct country for a region, handling special cases like US territories
-    """
-    us_territories = ['GUAM', 'PUERTO RICO', 'VIRGIN ISLANDS', 'VIRGIN ISLANDS (U.S.)']
     
-    if any(territory in region_name.upper() for territory in us_territories):
+    Memoized: the same region name comes back for every city row under it.
+    """
+    region_upper = region_name.upper()
+    if any(territory in region_upper for territory in _US_TERRITORIES):
         return "United States"
     
     return default_country
 
 
-def parse_position_based_text(page, page_num: int) -> List[Dict]:
+def parse_position_based_text(page, page_num: int, page_text: Optional[str] = None) -> List[Multiplier]:
     """
-    Parse using cropped regions to handle multi-column layouts
+    Parse column by column to handle multi-column layouts
     Divides page into 3 equal columns and parses each independently
     
     Args:
         page: pdfplumber page object
         page_num: Page number (1-indexed)
+        page_text: Text already extracted from the page (extracted here if omitted)
     
     Returns:
-        List of multiplier dictionaries
+        List of Multiplier entries
     """
     multipliers = []
     
-    # Determine country from page text
-    page_text = page.extract_text()
-    if 'CANADA' in page_text.upper():
+    # Determine country from page text, reusing the caller's extraction
+    if page_text is None:
+        page_text = page.extract_text()
+    page_text_upper = page_text.upper()
+    if 'CANADA' in page_text_upper:
         default_country = "Canada"
-    elif 'UNITED STATES' in page_text.upper():
+    elif 'UNITED STATES' in page_text_upper:
         default_country = "United States"
     else:
         default_country = "Unknown"
     
     # Get page dimensions
     page_width = page.width
-    page_height = page.height
     
     # Define 3 columns (typical MVS layout)
     num_columns = 3
@@ -334,21 +610,23 @@ def parse_position_based_text(page, page_num: int) -> List[Dict]:
     current_region = None
     parent_region = None  # Track parent region for subsections like "NEW YORK CITY AREA"
     
+    # The page's characters are split into column strips directly, with the same
+    # overlap test page.crop() applies, rather than building a cropped page per column
+    chars = page.chars
+    
     # Process each column
     for col_idx in range(num_columns):
-        # Use crop-based extraction with adjusted boundaries
+        # Column boundaries, adjusted
         # For columns 2 and 3, shift left boundary to capture first letters
         # 6 pixels is enough to capture cut-off letters without too much overlap
         left_shift = 6 if col_idx > 0 else 0
         
         x0 = (col_idx * column_width) - left_shift
         x1 = (col_idx + 1) * column_width
-        y0 = 0
-        y1 = page_height
         
-        # Crop to this column
-        cropped = page.crop((x0, y0, x1, y1))
-        column_text = cropped.extract_text()
+        # Characters touching this column, as a full-height crop would keep them
+        column_chars = [c for c in chars if c['x1'] >= x0 and c['x0'] <= x1]
+        column_text = pdfplumber.utils.extract_text(column_chars)
         
         if not column_text:
             continue
@@ -368,21 +646,9 @@ def parse_position_based_text(page, page_num: int) -> List[Dict]:
             # Skip headers and tax table
             # Use word boundary matching for short keywords to avoid false matches (e.g., "Kingston" contains "GST")
             line_upper = line.upper()
-            import re
-            skip = False
-            
-            # Check for exact phrases or start-of-line matches
-            if any(phrase in line_upper for phrase in [
-                'LOCAL MULTIPLIER', 'SECTION 99', 'MARSHALL', 'APPLY TO',
-                'TAX REMOVAL', 'DEDUCTION', 'EXAMPLE:', 'CANADA', 'UNITED STATES'
-            ]):
-                skip = True
             
-            # Check for whole word matches for short keywords using word boundaries
-            if re.search(r'\b(GST|PST|HST|CLASS|PAGE)\b', line_upper):
-                skip = True
-            
-            if skip:
+            # Check for exact phrases, then whole word matches for short keywords
+            if _RE_SKIP_PHRASE.search(line_upper) or _RE_SKIP_SHORT.search(line_upper):
                 continue
             
             # Skip lines with percentages
@@ -402,29 +668,26 @@ def parse_position_based_text(page, page_num: int) -> List[Dict]:
                         next_line = lines[line_idx + 1].strip()
                         next_parts = next_line.split()
                         # Check if next line is just numbers
-                        if len(next_parts) >= 5:
-                            try:
-                                next_values = [float(p) for p in next_parts if 0.5 <= float(p) <= 2.5]
-                                if len(next_values) >= 5:
-                                    # This is a region header split across lines
-                                    current_region = cleaned_line
-                                    entry_country = get_country_for_region(cleaned_line, default_country)
-                                    multipliers.append({
-                                        'location': cleaned_line,
-                                        'city': None,
-                                        'region': cleaned_line,
-                                        'country': entry_country,
-                                        'class_a': next_values[-5],
-                                        'class_b': next_values[-4],
-                                        'class_c': next_values[-3],
-                                        'class_d': next_values[-2],
-                                        'class_s': next_values[-1],
-                                        'source_page': page_num,
-                                        'is_regional': True,
-                                    })
-                                    continue
-                            except (ValueError, IndexError):
-                                pass
+                        if len(next_parts) >= 5 and all(_RE_NUMBER.fullmatch(p) for p in next_parts):
+                            next_values = [val for val in map(float, next_parts) if 0.5 <= val <= 2.5]
+                            if len(next_values) >= 5:
+                                # This is a region header split across lines
+                                current_region = cleaned_line
+                                entry_country = get_country_for_region(cleaned_line, default_country)
+                                multipliers.append(Multiplier(
+                                    location=cleaned_line,
+                                    city=None,
+                                    region=cleaned_line,
+                                    country=entry_country,
+                                    class_a=next_values[-5],
+                                    class_b=next_values[-4],
+                                    class_c=next_values[-3],
+                                    class_d=next_values[-2],
+                                    class_s=next_values[-1],
+                                    source_page=page_num,
+                                    is_regional=True,
+                                ))
+                                continue
                 continue
             
             # Extract numeric values (multipliers)
@@ -434,23 +697,21 @@ def parse_position_based_text(page, page_num: int) -> List[Dict]:
             location_parts = []
             has_seen_text = False
             
-            for part in parts:
-                try:
-                    if '%' in part:
-                        continue
-                    val = float(part)
+            for number, text in _RE_TOKEN.findall(line):
+                if number:
+                    val = float(number)
                     if 0.5 <= val <= 2.5:
                         # Only collect multipliers that appear after we've seen text
                         # This helps skip trailing numbers from previous column
                         if has_seen_text or len(location_parts) > 0:
                             multiplier_values.append(val)
                         # If we haven't seen text yet and this looks like a stray number, skip it
-                except ValueError:
+                elif '%' not in text:
                     # This is text (location name part)
                     has_seen_text = True
                     # Only collect location parts before we have 5 multipliers
                     if len(multiplier_values) < 5:
-                        location_parts.append(part)
+                        location_parts.append(text)
             
             if len(multiplier_values) >= 5:
                 location_name = ' '.join(location_parts).strip()
@@ -473,7 +734,7 @@ def parse_position_based_text(page, page_num: int) -> List[Dict]:
                 is_region = location_name.isupper()
                 
                 # Handle "(Continued)" suffix in region names
-                clean_location_name = location_name.replace('(CONTINUED)', '').replace('(Continued)', '').strip()
+                clean_location_name = _RE_CONTINUED.sub('', location_name).strip()
                 
                 # Determine the country (handles US territories)
                 entry_country = get_country_for_region(clean_location_name, default_country)
@@ -481,7 +742,7 @@ def parse_position_based_text(page, page_num: int) -> List[Dict]:
                 if is_region:
                     # Check if this is a subsection (e.g., "NEW YORK CITY AREA")
                     # Subsections typically contain keywords like "AREA", "COUNTY", etc. and are still in parent state
-                    is_subsection = any(keyword in clean_location_name for keyword in ['AREA', 'REGION', 'DISTRICT'])
+                    is_subsection = any(keyword in clean_location_name for keyword in _SUBSECTION_KEYWORDS)
                     
                     if is_subsection and current_region and current_region != clean_location_name:
                         # This is a subsection within a parent region (e.g., "NEW YORK CITY AREA" within "NEW YORK")
@@ -492,41 +753,41 @@ def parse_position_based_text(page, page_num: int) -> List[Dict]:
                         parent_region = None
                         current_region = clean_location_name
                     
-                    multipliers.append({
-                        'location': clean_location_name,
-                        'city': None,
-                        'region': clean_location_name,
-                        'country': entry_country,
-                        'class_a': class_multipliers[0],
-                        'class_b': class_multipliers[1],
-                        'class_c': class_multipliers[2],
-                        'class_d': class_multipliers[3],
-                        'class_s': class_multipliers[4],
-                        'source_page': page_num,
-                        'is_regional': True,
-                    })
+                    multipliers.append(Multiplier(
+                        location=clean_location_name,
+                        city=None,
+                        region=clean_location_name,
+                        country=entry_country,
+                        class_a=class_multipliers[0],
+                        class_b=class_multipliers[1],
+                        class_c=class_multipliers[2],
+                        class_d=class_multipliers[3],
+                        class_s=class_multipliers[4],
+                        source_page=page_num,
+                        is_regional=True,
+                    ))
                 else:
                     # For cities, also check if they belong to a US territory
                     city_country = get_country_for_region(current_region if current_region else "", entry_country)
                     
-                    multipliers.append({
-                        'location': f"{location_name}, {current_region}" if current_region else location_name,
-                        'city': location_name,
-                        'region': current_region,
-                        'country': city_country,
-                        'class_a': class_multipliers[0],
-                        'class_b': class_multipliers[1],
-                        'class_c': class_multipliers[2],
-                        'class_d': class_multipliers[3],
-                        'class_s': class_multipliers[4],
-                        'source_page': page_num,
-                        'is_regional': False,
-                    })
+                    multipliers.append(Multiplier(
+                        location=f"{location_name}, {current_region}" if current_region else location_name,
+                        city=location_name,
+                        region=current_region,
+                        country=city_country,
+                        class_a=class_multipliers[0],
+                        class_b=class_multipliers[1],
+                        class_c=class_multipliers[2],
+                        class_d=class_multipliers[3],
+                        class_s=class_multipliers[4],
+                        source_page=page_num,
+                        is_regional=False,
+                    ))
     
     return multipliers
 
 
-def parse_text_data(page_text: str, page_num: int) -> List[Dict]:
+def parse_text_data(page_text: str, page_num: int) -> List[Multiplier]:
     """
     Fallback text-based parsing if table extraction fails
     
@@ -539,9 +800,10 @@ def parse_text_data(page_text: str, page_num: int) -> List[Dict]:
     current_country = "Unknown"
     
     # Determine country
-    if 'CANADA' in page_text.upper():
+    page_text_upper = page_text.upper()
+    if 'CANADA' in page_text_upper:
         current_country = "Canada"
-    elif 'UNITED STATES' in page_text.upper():
+    elif 'UNITED STATES' in page_text_upper:
         current_country = "United States"
     
     lines = page_text.split('\n')
@@ -551,12 +813,8 @@ def parse_text_data(page_text: str, page_num: int) -> List[Dict]:
         if not line:
             continue
         
-        # Skip header/footer lines
-        if any(keyword in line.upper() for keyword in ['LOCAL MULTIPLIER', 'SECTION 99', 'PAGE', 'MARSHALL', 'APPLY TO']):
-            continue
-        
-        # Skip tax removal table lines
-        if any(keyword in line.upper() for keyword in ['TAX REMOVAL', 'DEDUCTION', 'EXAMPLE:', 'GST', 'PST', 'HST']):
+        # Skip header/footer lines and tax removal table lines
+        if _RE_TEXT_SKIP.search(line.upper()):
             continue
         
         # Skip lines with percentage signs
@@ -576,19 +834,18 @@ def parse_text_data(page_text: str, page_num: int) -> List[Dict]:
         location_parts = []
         
         for part in parts:
-            try:
-                # Skip percentage values
-                if '%' in part:
-                    continue
-                    
+            # Skip percentage values
+            if '%' in part:
+                continue
+            
+            if _RE_NUMBER.fullmatch(part):
                 val = float(part)
                 
                 # Only accept reasonable multiplier values (0.5 to 2.5)
                 if 0.5 <= val <= 2.5:
                     multiplier_values.append(val)
-            except ValueError:
-                if len(multiplier_values) < 5:
-                    location_parts.append(part)
+            elif len(multiplier_values) < 5:
+                location_parts.append(part)
         
         if len(multiplier_values) >= 5:
             location_name = ' '.join(location_parts)
@@ -599,108 +856,97 @@ def parse_text_data(page_text: str, page_num: int) -> List[Dict]:
             
             if is_region:
                 current_region = location_name
-                multipliers.append({
-                    'location': location_name,
-                    'city': None,
-                    'region': location_name,
-                    'country': current_country,
-                    'class_a': class_multipliers[0],
-                    'class_b': class_multipliers[1],
-                    'class_c': class_multipliers[2],
-                    'class_d': class_multipliers[3],
-                    'class_s': class_multipliers[4],
-                    'source_page': page_num,
-                    'is_regional': True,
-                })
+                multipliers.append(Multiplier(
+                    location=location_name,
+                    city=None,
+                    region=location_name,
+                    country=current_country,
+                    class_a=class_multipliers[0],
+                    class_b=class_multipliers[1],
+                    class_c=class_multipliers[2],
+                    class_d=class_multipliers[3],
+                    class_s=class_multipliers[4],
+                    source_page=page_num,
+                    is_regional=True,
+                ))
             else:
-                multipliers.append({
-                    'location': f"{location_name}, {current_region}" if current_region else location_name,
-                    'city': location_name,
-                    'region': current_region,
-                    'country': current_country,
-                    'class_a': class_multipliers[0],
-                    'class_b': class_multipliers[1],
-                    'class_c': class_multipliers[2],
-                    'class_d': class_multipliers[3],
-                    'class_s': class_multipliers[4],
-                    'source_page': page_num,
-                    'is_regional': False,
-                })
+                multipliers.append(Multiplier(
+                    location=f"{location_name}, {current_region}" if current_region else location_name,
+                    city=location_name,
+                    region=current_region,
+                    country=current_country,
+                    class_a=class_multipliers[0],
+                    class_b=class_multipliers[1],
+                    class_c=class_multipliers[2],
+                    class_d=class_multipliers[3],
+                    class_s=class_multipliers[4],
+                    source_page=page_num,
+                    is_regional=False,
+                ))
     
     return multipliers
 
 
-def save_to_markdown(multipliers: List[Dict], output_path: str) -> None:
+def save_to_markdown(multipliers: List[Multiplier], output_path: str) -> None:
     """
     Save parsed multipliers to markdown file
     
     Args:
-        multipliers: List of multiplier dictionaries
+        multipliers: List of Multiplier entries
         output_path: Path to output markdown file
     """
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("# LOCAL MULTIPLIERS\n\n")
-        f.write("**Source:** Marshall Valuation Service - Section 99\n")
-        f.write(f"**Total Entries:** {len(multipliers)}\n")
-        f.write(f"**Last Updated:** July 2025\n\n")
-        
-        f.write("## About Local Multipliers\n\n")
-        f.write("Local multipliers adjust base construction costs for regional variations in:\n")
-        f.write("- Labor costs\n")
-        f.write("- Material availability and pricing\n")
-        f.write("- Local building codes and requirements\n")
-        f.write("- Market conditions\n\n")
-        
-        f.write("Apply these multipliers to costs brought up-to-date from base cost tables.\n\n")
-        
-        f.write("## Multiplier Table\n\n")
+    lines = [
+        "# LOCAL MULTIPLIERS\n\n",
+        "**Source:** Marshall Valuation Service - Section 99\n",
+        f"**Total Entries:** {len(multipliers)}\n",
+        f"**Last Updated:** July 2025\n\n",
+        "## About Local Multipliers\n\n",
+        "Local multipliers adjust base construction costs for regional variations in:\n",
+        "- Labor costs\n",
+        "- Material availability and pricing\n",
+        "- Local building codes and requirements\n",
+        "- Market conditions\n\n",
+        "Apply these multipliers to costs brought up-to-date from base cost tables.\n\n",
+        "## Multiplier Table\n\n",
+    ]
+    
+    if multipliers:
+        # Group by country for better organization
+        by_country = {}
+        for mult in multipliers:
+            by_country.setdefault(mult.country, []).append(mult)
         
-        if multipliers:
-            # Group by country for better organization
-            by_country = {}
-            for mult in multipliers:
-                country = mult.get('country', 'Unknown')
-                if country not in by_country:
-                    by_country[country] = []
-                by_country[country].append(mult)
+        for country, entries in by_country.items():
+            lines.append(f"### {country}\n\n")
+            lines.append("| Location | Region | Class A | Class B | Class C | Class D | Class S | Page |\n")
+            lines.append("| --- | --- | --- | --- | --- | --- | --- | --- |\n")
             
-            for country, entries in by_country.items():
-                f.write(f"### {country}\n\n")
-                f.write("| Location | Region | Class A | Class B | Class C | Class D | Class S | Page |\n")
-                f.write("| --- | --- | --- | --- | --- | --- | --- | --- |\n")
-                
-                for mult in entries:
-                    location = mult.get('location', 'Unknown')
-                    region = mult.get('region', '')
-                    class_a = mult.get('class_a', '')
-                    class_b = mult.get('class_b', '')
-                    class_c = mult.get('class_c', '')
-                    class_d = mult.get('class_d', '')
-                    class_s = mult.get('class_s', '')
-                    page = mult.get('source_page', '')
-                    
-                    # Format location (bold if regional)
-                    if mult.get('is_regional'):
-                        location = f"**{location}**"
-                    
-                    f.write(f"| {location} | {region} | {class_a} | {class_b} | {class_c} | {class_d} | {class_s} | {page} |\n")
+            for mult in entries:
+                # Format location (bold if regional)
+                location = f"**{mult.location}**" if mult.is_regional else mult.location
                 
-                f.write("\n")
-        else:
-            f.write("*No multipliers extracted*\n")
+                lines.append(f"| {location} | {mult.region} | {mult.class_a} | {mult.class_b} | {mult.class_c} | {mult.class_d} | {mult.class_s} | {mult.source_page} |\n")
+            
+            lines.append("\n")
+    else:
+        lines.append("*No multipliers extracted*\n")
     
-    print(f"[SAVED] Markdown: {output_file}")
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+    
+    logger.info("Saved markdown: %s", output_file)
 
 
-def save_to_json(multipliers: List[Dict], output_path: str) -> None:
+def save_to_json(multipliers: List[Multiplier], output_path: str) -> None:
     """
     Save parsed multipliers to JSON file for potential database import
+    (with orjson when it is installed)
     
     Args:
-        multipliers: List of multiplier dictionaries
+        multipliers: List of Multiplier entries
         output_path: Path to output JSON file
     """
     output_file = Path(output_path)
@@ -708,30 +954,32 @@ def save_to_json(multipliers: List[Dict], output_path: str) -> None:
     
     # Count statistics
     total = len(multipliers)
-    by_country = {}
-    regional_count = sum(1 for m in multipliers if m.get('is_regional'))
+    by_country = Counter(m.country for m in multipliers)
+    regional_count = sum(m.is_regional for m in multipliers)
     city_count = total - regional_count
     
-    for mult in multipliers:
-        country = mult.get('country', 'Unknown')
-        by_country[country] = by_country.get(country, 0) + 1
+    payload = {
+        'metadata': {
+            'source': 'Marshall Valuation Service - Section 99',
+            'updated': 'July 2025',
+            'total_entries': total,
+            'regional_entries': regional_count,
+            'city_entries': city_count,
+            'countries': by_country,
+        },
+        'multipliers': multipliers
+    }
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'metadata': {
-                'source': 'Marshall Valuation Service - Section 99',
-                'updated': 'July 2025',
-                'total_entries': total,
-                'regional_entries': regional_count,
-                'city_entries': city_count,
-                'countries': by_country,
-            },
-            'multipliers': multipliers
-        }, f, indent=2)
-    
-    print(f"[SAVED] JSON: {output_file}")
-    print(f"   Total entries: {total} ({regional_count} regional, {city_count} cities)")
-    print(f"   Countries: {', '.join(by_country.keys())}")
+    # Both serialize the Multiplier dataclasses directly; keys keep their written order
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, default=asdict)
+    
+    logger.info("Saved JSON: %s", output_file)
+    logger.info("   Total entries: %d (%d regional, %d cities)", total, regional_count, city_count)
+    logger.info("   Countries: %s", ', '.join(by_country))
 
 
 def main():
@@ -739,16 +987,20 @@ def main():
     Main entry point for command-line usage
     """
     if len(sys.argv) < 4:
-        print("Usage: python parse-local-multipliers.py <pdf_path> <start_page> <end_page>")
-        print("Example: python parse-local-multipliers.py MVS.pdf 719 724")
+        print("Usage: python -m app.parsers.local_multipliers_original <pdf_path> <start_page> <end_page>")
+        print("Example: python -m app.parsers.local_multipliers_original MVS.pdf 719 724")
         sys.exit(1)
     
+    # Progress goes to stderr through one root handler. Workers share it under the
+    # fork start method (the Linux default); spawned workers only report warnings.
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+    
     pdf_path = sys.argv[1]
     start_page = int(sys.argv[2])
     end_page = int(sys.argv[3])
     
-    # Parse the PDF
-    results = parse_local_multiplier_table(pdf_path, start_page, end_page)
+    # Parse the pages in parallel worker processes
+    results = parse_local_multiplier_table(pdf_path, start_page, end_page, max_workers=os.cpu_count() or 1)
     
     if results['success']:
         # Save output
@@ -4,12 +4,15 @@ Uses the original MVS_Agent parser logic and writes to PostgreSQL.
 Supports section-specific story height tables (S11, S13, S14, S15, etc.)
 """
 
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Optional
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 from app.database import StoryHeightMultiplier
+from app.parsers.cache import CACHE_DIR, load_json, write_json_atomic
 
 # Import from the original parser
-from app.parsers.story_height_original import parse_story_height_table
+from app.parsers.story_height_original import PARSER_VERSION, parse_story_height_table
 
 
 # Section-specific PDF page numbers for story height tables
@@ -20,18 +23,51 @@ SECTION_STORY_HEIGHT_PAGES = {
     # 15: TBD - pages 38-40 not yet extracted from PDF
 }
 
+# Last successful save per version + section (parser version, file hash, page, record
+# count), so a re-run on an unchanged PDF can return without re-parsing or rewriting
+# rows. One file per version + section, so concurrent section saves never rewrite each
+# other's records. Best-effort: a missing or stale record only costs a re-parse.
+_SAVED_RUNS_DIR = CACHE_DIR / "story_height_runs"
 
-def parse_and_save(pdf_path: str, db: Session, page: int = 90, section: int = 11, pdf_version_id: int = None) -> int:
+
+def saved_run_path(pdf_version_id: int, section: int) -> Path:
+    """Saved-run record file for one version + section"""
+    return _SAVED_RUNS_DIR / f"{pdf_version_id}_{section}.json"
+
+
+def load_saved_run(pdf_version_id: int, section: int) -> Optional[Dict]:
+    """Saved-run record written by an earlier call to parse_and_save, or None"""
+    run = load_json(saved_run_path(pdf_version_id, section))
+    return run if isinstance(run, dict) else None
+
+
+def record_saved_run(pdf_version_id: int, section: int, run: Dict) -> None:
+    """Store one saved-run record; failures only cost the skip on the next run"""
+    try:
+        write_json_atomic(saved_run_path(pdf_version_id, section), run)
+    except OSError as e:
+        print(f"[StoryHeight] Could not record saved run: {e}")
+
+
+def parse_and_save(pdf_path: str, db: Session, page: int = 90, section: int = 11, pdf_version_id: int = None,
+                   force_refresh: bool = False, file_hash: Optional[str] = None) -> int:
     """
     Parse story height multipliers from PDF using original parser and save to database.
     Only clears and replaces records for the specified section.
     
+    When file_hash is given and the same file and page were already saved for this
+    version and section by the current parser, and those records are still in the
+    database, nothing is re-parsed.
+    
     Args:
         pdf_path: Path to MVS PDF file
         db: SQLAlchemy database session
         page: Page number (1-indexed), default 90 (S11)
         section: MVS section number (11, 13, 14, 15, etc.)
         pdf_version_id: Optional PDF version ID to associate with records
+        force_refresh: Re-parse and rewrite the records even if the PDF is unchanged
+        file_hash: SHA-256 of pdf_path as stored on the PDF version (PdfVersion.file_hash);
+                   without it the records are always rewritten
     
     Returns:
         Number of records updated
@@ -39,6 +75,21 @@ def parse_and_save(pdf_path: str, db: Session, page: int = 90, section: int = 11
     print(f"[StoryHeight] Parsing section {section} from: {pdf_path}")
     print(f"[StoryHeight] Page {page}")
     
+    # Only version-scoped saves replace their rows, so only they can be skipped
+    can_skip = bool(pdf_version_id and file_hash)
+    
+    if can_skip and not force_refresh:
+        saved = load_saved_run(pdf_version_id, section)
+        if (saved and saved.get('parser_version') == PARSER_VERSION
+                and saved.get('file_hash') == file_hash and saved.get('page') == page):
+            existing = db.query(func.count(StoryHeightMultiplier.id)).filter(
+                StoryHeightMultiplier.section == section,
+                StoryHeightMultiplier.pdf_version_id == pdf_version_id
+            ).scalar()
+            if existing == saved.get('count'):
+                print(f"[StoryHeight] PDF unchanged, keeping {existing} records for section {section}, version {pdf_version_id}")
+                return existing
+    
     # Use the original parser
     results = parse_story_height_table(pdf_path, page)
     
@@ -48,34 +99,43 @@ def parse_and_save(pdf_path: str, db: Session, page: int = 90, section: int = 11
     multipliers = results['multipliers']
     print(f"[StoryHeight] Parsed {len(multipliers)} entries for section {section}")
     
-    # Version-isolated: only delete rows for THIS version + section
+    # Version-isolated: only delete rows for THIS version + section, then insert in one transaction
     if pdf_version_id:
         deleted = db.query(StoryHeightMultiplier).filter(
             StoryHeightMultiplier.section == section,
             StoryHeightMultiplier.pdf_version_id == pdf_version_id
-        ).delete()
+        ).delete(synchronize_session=False)
         print(f"[StoryHeight] Cleared {deleted} existing records for section {section}, version {pdf_version_id}")
     
-    # Save to database
-    for m in multipliers:
-        record = StoryHeightMultiplier(
-            section=section,
-            height_meters=m.get('height_meters', 0),
-            height_feet=m['height_feet'],
-            sqft_multiplier=m['sqft_multiplier'],
-            cuft_multiplier=m['cuft_multiplier'],
-            source_page=m.get('source_page', page),
-            pdf_version_id=pdf_version_id,
-        )
-        db.add(record)
+    # Save to database as one Core executemany INSERT; the rows are plain values, so
+    # they skip ORM mapping and unit-of-work bookkeeping entirely
+    rows = [
+        {
+            'section': section,
+            'height_meters': m.get('height_meters', 0),
+            'height_feet': m['height_feet'],
+            'sqft_multiplier': m['sqft_multiplier'],
+            'cuft_multiplier': m['cuft_multiplier'],
+            'source_page': m.get('source_page', page),
+            'pdf_version_id': pdf_version_id,
+        }
+        for m in multipliers
+    ]
+    if rows:
+        db.execute(insert(StoryHeightMultiplier.__table__), rows)
     
     db.commit()
     print(f"[StoryHeight] Saved {len(multipliers)} records for section {section}")
     
+    if can_skip:
+        record_saved_run(pdf_version_id, section, {'parser_version': PARSER_VERSION, 'file_hash': file_hash,
+                                                   'page': page, 'count': len(multipliers)})
+    
     return len(multipliers)
 
 
-def parse_all_sections(pdf_path: str, db: Session, pdf_version_id: int = None) -> Dict[int, int]:
+def parse_all_sections(pdf_path: str, db: Session, pdf_version_id: int = None,
+                       file_hash: Optional[str] = None, force_refresh: bool = False) -> Dict[int, int]:
     """
     Parse story height multipliers for all known sections.
     
@@ -85,7 +145,8 @@ def parse_all_sections(pdf_path: str, db: Session, pdf_version_id: int = None) -
     results = {}
     for section, page in SECTION_STORY_HEIGHT_PAGES.items():
         try:
-            count = parse_and_save(pdf_path, db, page=page, section=section, pdf_version_id=pdf_version_id)
+            count = parse_and_save(pdf_path, db, page=page, section=section, pdf_version_id=pdf_version_id,
+                                   force_refresh=force_refresh, file_hash=file_hash)
             results[section] = count
         except Exception as e:
             print(f"[StoryHeight] Failed to parse section {section}: {e}")
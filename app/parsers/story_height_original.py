@@ -8,12 +8,42 @@ Base height is 10 ft (3.05m) with multiplier 1.000.
 """
 
 import pdfplumber
+from pdfminer.pdftypes import resolve1
 import json
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Wall heights in a story height table (7-24 ft)
+STORY_HEIGHT_ROWS = 18
+
+# Bump when a change alters parsed output, so callers that skip re-parsing an
+# unchanged PDF pick up the new results
+PARSER_VERSION = 1
+
+# Plausible ranges for a story height row; anything outside is not table data
+_METERS_MIN, _METERS_MAX = 1.5, 10.0
+_FEET_MIN, _FEET_MAX = 5, 30
+_MULT_MIN, _MULT_MAX = 0.4, 2.0
+
+# "SECTION XX PAGE YY" page header
+_SECTION_RE = re.compile(r'SECTION\s+(\d+)\s+PAGE\s+(\d+)', re.IGNORECASE)
+
+# A plain decimal number ("3.05", "10", ".95"), checked before calling float()
+_NUM_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)')
 
 
 def extract_section_info(page_text: str) -> Tuple[str, str]:
@@ -22,7 +52,7 @@ def extract_section_info(page_text: str) -> Tuple[str, str]:
     section_page = ""
     
     # Look for "SECTION XX PAGE YY" pattern
-    match = re.search(r'SECTION\s+(\d+)\s+PAGE\s+(\d+)', page_text, re.IGNORECASE)
+    match = _SECTION_RE.search(page_text)
     if match:
         section = match.group(1)
         section_page = match.group(2)
@@ -30,18 +60,83 @@ def extract_section_info(page_text: str) -> Tuple[str, str]:
     return section, section_page
 
 
-def parse_story_height_table(pdf_path: str, pdf_page: int) -> Dict:
+def parse_story_height_table(pdf_path: str, pdf_page: int, pdf=None) -> Dict:
     """
     Parse story height multiplier table from specified PDF page
     
     Args:
         pdf_path: Path to MVS PDF file
         pdf_page: PDF page number (1-indexed)
+        pdf: Already-open pdfplumber PDF to reuse instead of opening pdf_path again
     
     Returns:
         Dictionary containing parsed multiplier data and metadata
     """
-    results = {
+    return parse_story_height_tables(pdf_path, [pdf_page], pdf=pdf)[0]
+
+
+def parse_story_height_tables(pdf_path: str, pdf_pages: List[int], pdf=None) -> List[Dict]:
+    """
+    Parse story height multiplier tables from several PDF pages (one per
+    section), opening the PDF only once for the whole batch
+    
+    Args:
+        pdf_path: Path to MVS PDF file
+        pdf_pages: PDF page numbers (1-indexed)
+        pdf: Already-open pdfplumber PDF to reuse instead of opening pdf_path
+             again; the caller keeps ownership of it
+    
+    Returns:
+        List of per-page result dictionaries, in the same order as pdf_pages
+    """
+    if pdf is not None:
+        return parse_story_height_pages(pdf, pdf_pages)
+    
+    try:
+        print(f"[*] Opening PDF: {pdf_path}")
+        
+        # Only the requested pages are wrapped in pdfplumber Pages (pdf.pages would
+        # otherwise build one for every page of the document), and pdfminer reads
+        # from a memory map of the file instead of issuing a read syscall each time
+        with open(pdf_path, 'rb') as fh, \
+                mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf, \
+                pdfplumber.open(buf, pages=pdf_pages) as pdf:
+            return parse_story_height_pages(pdf, pdf_pages, filtered=True)
+        
+    except FileNotFoundError:
+        error_msg = f"PDF file not found: {pdf_path}"
+    except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+    
+    print(f"[ERROR] {error_msg}")
+    all_results = [new_page_results(pdf_page) for pdf_page in pdf_pages]
+    for results in all_results:
+        results['errors'].append(error_msg)
+    return all_results
+
+
+def parse_story_height_pages(pdf, pdf_pages: List[int], filtered: bool = False) -> List[Dict]:
+    """
+    Parse the given pages of an open PDF
+    
+    A full PDF is indexed by page number directly; a PDF opened with a page
+    filter (filtered=True) holds only those pages, so they are looked up by
+    their page_number instead.
+    """
+    if filtered:
+        pages_by_number = {page.page_number: page for page in pdf.pages}
+        return [parse_story_height_page(pdf, pages_by_number.get(pdf_page), pdf_page) for pdf_page in pdf_pages]
+    
+    page_count = len(pdf.pages)
+    return [
+        parse_story_height_page(pdf, pdf.pages[pdf_page - 1] if 1 <= pdf_page <= page_count else None, pdf_page)
+        for pdf_page in pdf_pages
+    ]
+
+
+def new_page_results(pdf_page: int) -> Dict:
+    """Empty result dictionary for one PDF page"""
+    return {
         'success': False,
         'section': '',
         'section_page': '',
@@ -49,39 +144,57 @@ def parse_story_height_table(pdf_path: str, pdf_page: int) -> Dict:
         'multipliers': [],
         'errors': []
     }
+
+
+def parse_story_height_page(pdf, page, pdf_page: int) -> Dict:
+    """
+    Parse story height multiplier table from one page of an open PDF
+    
+    Args:
+        pdf: Open pdfplumber PDF
+        page: The pdfplumber Page for pdf_page, or None if the PDF has no such page
+        pdf_page: PDF page number (1-indexed)
+    
+    Returns:
+        Dictionary containing parsed multiplier data and metadata
+    """
+    results = new_page_results(pdf_page)
     
     try:
-        print(f"[*] Opening PDF: {pdf_path}")
         print(f"[*] Processing PDF page {pdf_page}")
         
-        with pdfplumber.open(pdf_path) as pdf:
-            if pdf_page < 1 or pdf_page > len(pdf.pages):
-                raise ValueError(f"Invalid page. PDF has {len(pdf.pages)} pages.")
-            
-            page = pdf.pages[pdf_page - 1]
-            page_text = page.extract_text()
-            
-            # Extract section info
-            section, section_page = extract_section_info(page_text)
-            results['section'] = section
-            results['section_page'] = section_page
-            print(f"   Section {section}, Page {section_page}")
-            
-            # Parse the story height data
-            multipliers = parse_story_height_data(page, page_text)
-            
-            if multipliers:
-                results['success'] = True
-                results['multipliers'] = multipliers
-                print(f"   [+] Found {len(multipliers)} height multiplier entries")
-            else:
-                results['errors'].append("No multipliers found on page")
-                print(f"   [!] No multipliers found")
-                
-    except FileNotFoundError:
-        error_msg = f"PDF file not found: {pdf_path}"
-        print(f"[ERROR] {error_msg}")
-        results['errors'].append(error_msg)
+        if page is None:
+            page_count = resolve1(pdf.doc.catalog['Pages'])['Count']
+            raise ValueError(f"Invalid page. PDF has {page_count} pages.")
+        
+        # One layout pass: the header text is rebuilt from the same words the
+        # table parser uses instead of running extract_text() separately
+        # (page.chars is parsed by pdfminer once and cached on the page; the
+        # tolerances only affect word grouping, so nothing here re-parses it)
+        words = page.extract_words(x_tolerance=3, y_tolerance=3)
+        page_text = words_to_text(words)
+        
+        # Only the words are needed from here on; pdf.pages would otherwise keep
+        # the parsed chars alive until the PDF is closed
+        page.flush_cache()
+        
+        # Extract section info
+        section, section_page = extract_section_info(page_text)
+        results['section'] = section
+        results['section_page'] = section_page
+        print(f"   Section {section}, Page {section_page}")
+        
+        # Parse the story height data
+        multipliers = parse_story_height_data(words, page_text)
+        
+        if multipliers:
+            results['success'] = True
+            results['multipliers'] = multipliers
+            print(f"   [+] Found {len(multipliers)} height multiplier entries")
+        else:
+            results['errors'].append("No multipliers found on page")
+            print(f"   [!] No multipliers found")
+    
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
         print(f"[ERROR] {error_msg}")
@@ -90,9 +203,45 @@ def parse_story_height_table(pdf_path: str, pdf_page: int) -> Dict:
     return results
 
 
-def parse_story_height_data(page, page_text: str) -> List[Dict]:
+def parse_story_height_tables_parallel(pdf_path: str, pdf_pages: List[int], max_workers: Optional[int] = None) -> List[Dict]:
     """
-    Parse story height multiplier data from page
+    Parse story height multiplier tables from several PDF pages (one per
+    section) with the pages spread across worker processes
+    
+    Each worker opens the PDF itself, since pdfplumber objects cannot be
+    pickled. A single page is parsed in-process.
+    
+    Args:
+        pdf_path: Path to MVS PDF file
+        pdf_pages: PDF page numbers (1-indexed)
+        max_workers: Worker process count (default: one per page, up to the CPU count)
+    
+    Returns:
+        List of per-page result dictionaries, in the same order as pdf_pages
+    """
+    if len(pdf_pages) < 2:
+        return parse_story_height_tables(pdf_path, pdf_pages)
+    
+    max_workers = max_workers or min(len(pdf_pages), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(partial(parse_story_height_table, pdf_path), pdf_pages))
+
+
+def words_to_text(words: List[Dict], y_tolerance: float = 3) -> str:
+    """Join extracted words into lines of text, breaking where the top position jumps"""
+    lines = []
+    line_top = None
+    for word in words:
+        if line_top is None or abs(word['top'] - line_top) > y_tolerance:
+            lines.append([])
+            line_top = word['top']
+        lines[-1].append(word['text'])
+    return '\n'.join(' '.join(line) for line in lines)
+
+
+def parse_story_height_data(words: List[Dict], page_text: str) -> List[Dict]:
+    """
+    Parse story height multiplier data from a page's extracted words
     
     The table has two columns (left and right) with:
     - Average Wall Height (M.)
@@ -102,164 +251,174 @@ def parse_story_height_data(page, page_text: str) -> List[Dict]:
     """
     multipliers = []
     
-    # Extract words with positions
-    words = page.extract_words(x_tolerance=3, y_tolerance=3)
+    # Upper-case each word once, and index (top, text) by line so each STORY
+    # candidate only looks at nearby lines
+    upper_texts = [word['text'].upper() for word in words]
+    words_by_y = defaultdict(list)
+    for word, text in zip(words, upper_texts):
+        words_by_y[round(word['top'])].append((word['top'], text))
     
-    # Find "STORY HEIGHT MULTIPLIERS" header to identify table start
+    # Find the Y position where "STORY HEIGHT MULTIPLIERS" appears. Failing that, fall
+    # back to the first word containing STORY on a page that mentions HEIGHT.
+    page_has_height = 'HEIGHT' in page_text.upper()
     story_height_y = None
-    for word in words:
-        if 'STORY' in word['text'].upper() and 'HEIGHT' in page_text.upper():
-            # Check if this is part of STORY HEIGHT MULTIPLIERS
-            story_height_y = word['top']
-            break
-    
-    # Better approach: find the Y position where "STORY HEIGHT MULTIPLIERS" appears
-    for i, word in enumerate(words):
-        if word['text'].upper() == 'STORY':
+    fallback_y = None
+    for word, text in zip(words, upper_texts):
+        if fallback_y is None and page_has_height and 'STORY' in text:
+            fallback_y = word['top']
+        if text == 'STORY':
             # Look for HEIGHT and MULTIPLIERS nearby
-            nearby = [w for w in words if abs(w['top'] - word['top']) < 10]
-            nearby_text = ' '.join(w['text'].upper() for w in nearby)
-            if 'HEIGHT' in nearby_text and 'MULTIPLIER' in nearby_text:
+            top = round(word['top'])
+            nearby = [
+                near_text
+                for y in range(top - 10, top + 11)
+                for near_top, near_text in words_by_y.get(y, ())
+                if abs(near_top - word['top']) < 10
+            ]
+            if any('HEIGHT' in t for t in nearby) and any('MULTIPLIER' in t for t in nearby):
                 story_height_y = word['top']
                 print(f"   Found STORY HEIGHT MULTIPLIERS at y={story_height_y:.0f}")
                 break
     
+    if story_height_y is None:
+        story_height_y = fallback_y
+    
     if not story_height_y:
         print("   [!] Could not locate STORY HEIGHT MULTIPLIERS header")
         return multipliers
     
-    # Group words by Y position (rows) - only words below the header
-    rows_by_y = defaultdict(list)
-    for word in words:
-        if word['top'] > story_height_y + 30:  # Below the header
-            y_key = round(word['top'] / 10) * 10
-            rows_by_y[y_key].append(word)
-    
-    # Sort rows by Y
-    sorted_rows = sorted(rows_by_y.items(), key=lambda x: x[0])
-    
-    # Find data rows - they should have numeric values
+    # Classify each numeric word below the header by row (Y bucket) and column (left/right
+    # of the page middle) in one pass; labels never reach the row loop
     # Expected pattern: meters, feet, sqft_mult, cuft_mult (repeated twice for left/right columns)
-    for y_pos, row_words in sorted_rows:
-        row_words = sorted(row_words, key=lambda w: w['x0'])
-        
-        # Extract numbers from this row
-        numbers = []
-        for word in row_words:
+    page_mid = 400  # Approximate middle of page
+    table_top = story_height_y + 30
+    cells = []
+    for word in words:
+        if word['top'] > table_top:  # Below the header
             text = word['text'].replace(',', '').replace('(base)', '')
-            try:
-                num = float(text)
-                numbers.append((num, word['x0']))
-            except ValueError:
-                continue
-        
-        # We need at least 4 numbers for one column, or 8 for both
-        if len(numbers) >= 4:
-            # Determine if this is a data row by checking if values are reasonable
-            # Wall height in meters: 2-8, feet: 7-24, multipliers: 0.5-2.0
-            
-            # Split into left and right column based on X position
-            page_mid = 400  # Approximate middle of page
-            
-            left_nums = [n for n, x in numbers if x < page_mid]
-            right_nums = [n for n, x in numbers if x >= page_mid]
-            
-            # Process left column if we have 4 numbers
-            if len(left_nums) >= 4:
-                entry = create_entry(left_nums[:4])
-                if entry:
-                    multipliers.append(entry)
-            
-            # Process right column if we have 4 numbers
-            if len(right_nums) >= 4:
-                entry = create_entry(right_nums[:4])
-                if entry:
-                    multipliers.append(entry)
+            # Most words on the page are labels; reject them without raising
+            if _NUM_RE.fullmatch(text):
+                y_key = round(word['top'] / 10) * 10
+                cells.append((y_key, word['x0'] >= page_mid, word['x0'], float(text)))
     
-    # Sort by feet value
-    multipliers.sort(key=lambda x: x['height_feet'])
+    # One sort orders the cells top to bottom, left column first, then by X; each
+    # (row, column) run needs 4 numbers. create_entry() checks the values are
+    # reasonable (wall height in meters: 2-8, feet: 7-24, multipliers: 0.5-2.0)
+    # The table has one row per wall height, so a repeated height is noise: keep the
+    # first, and stop once every expected height has been found
+    cells.sort(key=itemgetter(0, 1, 2))
+    seen_feet = set()
+    for _, column in groupby(cells, key=itemgetter(0, 1)):
+        nums = [cell[3] for cell in column]
+        if len(nums) >= 4:
+            entry = create_entry(nums[:4])
+            if entry and entry[1] not in seen_feet:
+                seen_feet.add(entry[1])
+                multipliers.append(entry)
+                if len(multipliers) >= STORY_HEIGHT_ROWS:
+                    break
     
-    return multipliers
+    # Sort by feet value, then build the output dicts once
+    multipliers.sort(key=itemgetter(1))
+    
+    return [
+        {
+            'height_meters': meters,
+            'height_feet': feet,
+            'sqft_multiplier': sqft_mult,
+            'cuft_multiplier': cuft_mult
+        }
+        for meters, feet, sqft_mult, cuft_mult in multipliers
+    ]
 
 
-def create_entry(nums: List[float]) -> Dict:
+def create_entry(nums: List[float]) -> Optional[Tuple[float, int, float, float]]:
     """
     Create a multiplier entry from 4 numbers: meters, feet, sqft_mult, cuft_mult
+    
+    Returns:
+        (height_meters, height_feet, sqft_multiplier, cuft_multiplier), or None if
+        the numbers are not a plausible table row
     """
     if len(nums) < 4:
         return None
     
     meters, feet, sqft_mult, cuft_mult = nums[0], nums[1], nums[2], nums[3]
     
-    # Validate reasonable values
-    # Meters: 2-8, Feet: 7-25, Multipliers: 0.5-2.0
-    if not (1.5 <= meters <= 10):
-        return None
-    if not (5 <= feet <= 30):
-        return None
-    if not (0.4 <= sqft_mult <= 2.0):
-        return None
-    if not (0.4 <= cuft_mult <= 2.0):
+    # Validate reasonable values in one short-circuiting test
+    if not (_METERS_MIN <= meters <= _METERS_MAX and _FEET_MIN <= feet <= _FEET_MAX
+            and _MULT_MIN <= sqft_mult <= _MULT_MAX and _MULT_MIN <= cuft_mult <= _MULT_MAX):
         return None
     
-    return {
-        'height_meters': round(meters, 2),
-        'height_feet': int(feet),
-        'sqft_multiplier': round(sqft_mult, 3),
-        'cuft_multiplier': round(cuft_mult, 3)
-    }
+    return round(meters, 2), int(feet), round(sqft_mult, 3), round(cuft_mult, 3)
 
 
-def save_to_json(results: Dict, output_path: str) -> None:
-    """Save parsed multipliers to JSON file"""
+def save_to_json(results: Dict, output_path: str, make_parent_dir: bool = True) -> None:
+    """
+    Save parsed multipliers to JSON file (with orjson when it is installed)
+    
+    Pass make_parent_dir=False when the caller has already created the directory.
+    """
     output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    if make_parent_dir:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'metadata': {
-                'source': f"Marshall Valuation Service - Section {results['section']}, Page {results['section_page']}",
-                'pdf_page': results['pdf_page'],
-                'description': 'Story height multipliers - adjustments for wall heights above/below 10ft base',
-                'base_height': '10 ft (3.05m) = 1.000 multiplier'
-            },
-            'multipliers': results['multipliers']
-        }, f, indent=2)
+    payload = {
+        'metadata': {
+            'source': f"Marshall Valuation Service - Section {results['section']}, Page {results['section_page']}",
+            'pdf_page': results['pdf_page'],
+            'description': 'Story height multipliers - adjustments for wall heights above/below 10ft base',
+            'base_height': '10 ft (3.05m) = 1.000 multiplier'
+        },
+        'multipliers': results['multipliers']
+    }
+    
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
     
     print(f"[SAVED] JSON: {output_file}")
 
 
-def save_to_markdown(results: Dict, output_path: str) -> None:
-    """Save parsed multipliers to markdown file"""
+def save_to_markdown(results: Dict, output_path: str, make_parent_dir: bool = True) -> None:
+    """
+    Save parsed multipliers to markdown file
+    
+    Pass make_parent_dir=False when the caller has already created the directory.
+    """
     output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    if make_parent_dir:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
     
     section = results['section']
     section_page = results['section_page']
     pdf_page = results['pdf_page']
     multipliers = results['multipliers']
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(f"# STORY HEIGHT MULTIPLIERS - Section {section}\n\n")
-        f.write(f"**Source:** Marshall Valuation Service, Section {section}, Page {section_page}\n")
-        f.write(f"**PDF Page:** {pdf_page}\n\n")
-        f.write("*Multiply base cost by these factors for wall heights other than 10 ft (3.05m)*\n\n")
+    lines = [
+        f"# STORY HEIGHT MULTIPLIERS - Section {section}\n\n",
+        f"**Source:** Marshall Valuation Service, Section {section}, Page {section_page}\n",
+        f"**PDF Page:** {pdf_page}\n\n",
+        "*Multiply base cost by these factors for wall heights other than 10 ft (3.05m)*\n\n",
+    ]
+    
+    if multipliers:
+        lines.append("| Height (M.) | Height (Ft.) | Sq Ft Multiplier | Cu Ft Multiplier |\n")
+        lines.append("| --- | --- | --- | --- |\n")
         
-        if multipliers:
-            f.write("| Height (M.) | Height (Ft.) | Sq Ft Multiplier | Cu Ft Multiplier |\n")
-            f.write("| --- | --- | --- | --- |\n")
-            
-            for mult in multipliers:
-                meters = mult['height_meters']
-                feet = mult['height_feet']
-                sqft = mult['sqft_multiplier']
-                cuft = mult['cuft_multiplier']
-                
-                # Mark the base row
-                base_note = " (base)" if feet == 10 else ""
-                f.write(f"| {meters:.2f} | {feet}{base_note} | {sqft:.3f} | {cuft:.3f} |\n")
-        else:
-            f.write("*No multipliers extracted*\n")
+        # Mark the base row
+        lines.extend(
+            f"| {m['height_meters']:.2f} | {m['height_feet']}{' (base)' if m['height_feet'] == 10 else ''}"
+            f" | {m['sqft_multiplier']:.3f} | {m['cuft_multiplier']:.3f} |\n"
+            for m in multipliers
+        )
+    else:
+        lines.append("*No multipliers extracted*\n")
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(lines))
     
     print(f"[SAVED] Markdown: {output_file}")
 
@@ -268,41 +427,48 @@ def main():
     """
     Main entry point for command-line usage
     
-    Usage: python parse-height-multiplier.py <pdf_path> <pdf_page>
-    Example: python parse-height-multiplier.py data/pdfs/MVS.pdf 90
+    Usage: python -m app.parsers.story_height_original <pdf_path> <pdf_page> [<pdf_page> ...]
+    Example: python -m app.parsers.story_height_original data/pdfs/MVS.pdf 90 218 215
     """
     if len(sys.argv) < 3:
-        print("Usage: python parse-height-multiplier.py <pdf_path> <pdf_page>")
-        print("Example: python parse-height-multiplier.py data/pdfs/MVS.pdf 90")
-        print("\nExtracts story height multiplier table from the specified PDF page.")
+        print("Usage: python -m app.parsers.story_height_original <pdf_path> <pdf_page> [<pdf_page> ...]")
+        print("Example: python -m app.parsers.story_height_original data/pdfs/MVS.pdf 90 218 215")
+        print("\nExtracts story height multiplier tables from the specified PDF pages.")
         print("Output files are named by section (e.g., S11_STORY_HEIGHT.md)")
         sys.exit(1)
     
     pdf_path = sys.argv[1]
-    pdf_page = int(sys.argv[2])
+    pdf_pages = [int(arg) for arg in sys.argv[2:]]
     
-    # Parse the PDF page
-    results = parse_story_height_table(pdf_path, pdf_page)
+    # Parse the PDF pages, several sections at once when more than one is given
+    all_results = parse_story_height_tables_parallel(pdf_path, pdf_pages)
     
-    if results['success'] and results['section']:
-        # Save output with section-based naming
-        output_dir = Path(__file__).parent.parent / "Tables" / "Refinements" / "StoryHeight"
-        section = results['section']
-        
-        # Save as markdown
-        markdown_path = output_dir / f"S{section}_STORY_HEIGHT.md"
-        save_to_markdown(results, str(markdown_path))
-        
-        # Save as JSON
-        json_path = output_dir / f"S{section}_story_height.json"
-        save_to_json(results, str(json_path))
-        
-        print(f"\n[SUCCESS] Section {section} story height multipliers extracted!")
-        print(f"   Total entries: {len(results['multipliers'])}")
-    else:
-        print("\n[ERROR] Processing failed!")
-        for error in results['errors']:
-            print(f"   - {error}")
+    # Create the output directory once for every section written below
+    output_dir = Path(__file__).parent.parent / "Tables" / "Refinements" / "StoryHeight"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    failed = False
+    for results in all_results:
+        if results['success'] and results['section']:
+            # Save output with section-based naming
+            section = results['section']
+            
+            # Save as markdown
+            markdown_path = output_dir / f"S{section}_STORY_HEIGHT.md"
+            save_to_markdown(results, str(markdown_path), make_parent_dir=False)
+            
+            # Save as JSON
+            json_path = output_dir / f"S{section}_story_height.json"
+            save_to_json(results, str(json_path), make_parent_dir=False)
+            
+            print(f"\n[SUCCESS] Section {section} story height multipliers extracted!")
+            print(f"   Total entries: {len(results['multipliers'])}")
+        else:
+            failed = True
+            print(f"\n[ERROR] Processing failed for PDF page {results['pdf_page']}!")
+            for error in results['errors']:
+                print(f"   - {error}")
+    
+    if failed:
         sys.exit(1)
 
 